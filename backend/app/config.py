@@ -1,35 +1,50 @@
-import os
-from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 
-from dotenv import load_dotenv
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-load_dotenv()
 
-
-@dataclass
-class Settings:
+class Settings(BaseSettings):
     """Lightweight settings container; expand as secrets and config are wired."""
 
-    app_name: str = "Astrology Guidance Platform API"
-    environment: str = os.environ.get("APP_ENV", "local")
-    sharepoint_site: str = os.environ.get("SHAREPOINT_SITE", "https://tenant.sharepoint.com/sites/horos")
-    sharepoint_mode: str = os.environ.get("SHAREPOINT_MODE", "stub")
-    sharepoint_tenant_id: str = os.environ.get("SHAREPOINT_TENANT_ID", "")
-    sharepoint_client_id: str = os.environ.get("SHAREPOINT_CLIENT_ID", "")
-    sharepoint_client_secret: str = os.environ.get("SHAREPOINT_CLIENT_SECRET", "")
-    sharepoint_site_id: str = os.environ.get("SHAREPOINT_SITE_ID", "")
-    sharepoint_zodiac_list_id: str = os.environ.get("SHAREPOINT_ZODIAC_LIST_ID", "")
-    sharepoint_prompt_list_id: str = os.environ.get(
-        "SHAREPOINT_PROMPT_LIST_ID", "{5635A4ED-CDC7-453D-B2E2-36F0E71BCF8A}"
+    # Anchored to backend/.env so the file is found whatever the working directory is.
+    model_config = SettingsConfigDict(
+        env_file=Path(__file__).resolve().parents[1] / ".env", frozen=True, extra="ignore"
     )
-    sharepoint_cache_list_id: str = os.environ.get("SHAREPOINT_CACHE_LIST_ID", "{00ba0c35-37c0-422f-878f-639d45e9816a}")
-    sharepoint_timezone_alias_list_id: str = os.environ.get(
-        "SHAREPOINT_TIMEZONE_ALIAS_LIST_ID", "{b358d41f-7efa-4a1f-a6ef-6050c674a8f4}"
+
+    app_name: str = "Astrology Guidance Platform API"
+    environment: str = Field("local", validation_alias="APP_ENV")
+    sharepoint_site: str = "https://tenant.sharepoint.com/sites/horos"
+    sharepoint_mode: str = "stub"
+    sharepoint_tenant_id: str = ""
+    sharepoint_client_id: str = ""
+    sharepoint_client_secret: str = ""
+    sharepoint_site_id: str = ""
+    sharepoint_zodiac_list_id: str = ""
+    sharepoint_prompt_list_id: str = "{5635A4ED-CDC7-453D-B2E2-36F0E71BCF8A}"
+    sharepoint_cache_list_id: str = "{00ba0c35-37c0-422f-878f-639d45e9816a}"
+    sharepoint_timezone_alias_list_id: str = "{b358d41f-7efa-4a1f-a6ef-6050c674a8f4}"
+    openai_model: str = "gpt-4.1"
+    openai_api_key: str = ""
+    openai_base_url: str = "https://api.openai.com/v1"
+    otp_ttl_seconds: int = 600
+    otp_secret: str = ""
+    # Comma-separated; kept as a plain string because pydantic-settings JSON-decodes list-typed env values.
+    cors_origins_csv: str = Field(
+        "http://localhost:8500,http://localhost:3000,http://localhost:5173,"
+        "https://astrozone-frontend.azurewebsites.net,https://www.astrozone.in,https://astrozone.in",
+        validation_alias="CORS_ORIGINS",
     )
-    openai_model: str = os.environ.get("OPENAI_MODEL", "gpt-4.1")
-    openai_api_key: str = os.environ.get("OPENAI_API_KEY", "")
-    openai_base_url: str = os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1")
-    otp_ttl_seconds: int = int(os.environ.get("OTP_TTL_SECONDS", 600))
+
+    @property
+    def cors_origins(self) -> tuple[str, ...]:
+        return tuple(origin.strip() for origin in self.cors_origins_csv.split(",") if origin.strip())
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
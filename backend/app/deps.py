@@ -1,3 +1,9 @@
+from functools import lru_cache
+from typing import Optional
+
+import httpx
+
+from .config import settings
 from .services.guidance_service import GuidanceService
 from .services.otp_service import OTPService
 from .services.sharepoint_client import SharePointClientStub
@@ -6,10 +12,102 @@ from .services.translation_service import TranslationService
 from .services.zodiac_service import ZodiacService
 from .services.horoscope_service import HoroscopeService
 
-sharepoint_client = SharePointClientStub()
-otp_service = OTPService()
-guidance_service = GuidanceService(sharepoint_client)
-translation_service = TranslationService(sharepoint_client)
-zodiac_service = ZodiacService(sharepoint_client)
-panchang_service = PanchangService(sharepoint_client)
-horoscope_service = HoroscopeService(sharepoint_client)
+try:
+    from openai import AsyncOpenAI
+except ImportError:  # pragma: no cover
+    AsyncOpenAI = None
+
+
+@lru_cache(maxsize=1)
+def get_graph_http_client() -> httpx.AsyncClient:
+    # Keep-alive pool for Microsoft Graph and the token endpoint; avoids a TLS handshake per list call.
+    # Graph speaks HTTP/2, so concurrent list reads multiplex over one connection.
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=10),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_sharepoint_client() -> SharePointClientStub:
+    return SharePointClientStub(http_client=get_graph_http_client())
+
+
+@lru_cache(maxsize=1)
+def get_openai_async_http_client() -> httpx.AsyncClient:
+    # One keep-alive pool shared by every OpenAI SDK client; timeouts mirror the SDK defaults
+    # so long batch generations are not cut short.
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(600.0, connect=5.0),
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_openai_client() -> Optional["AsyncOpenAI"]:
+    """Process-wide AsyncOpenAI client, or None when the SDK or API key is unavailable."""
+    if AsyncOpenAI is None or not settings.openai_api_key:
+        return None
+    # Guidance retries via its own backoff policy and the panchang timezone prompts degrade to the
+    # fallback on failure, so SDK retries would only multiply latency.
+    return AsyncOpenAI(
+        api_key=settings.openai_api_key,
+        base_url=settings.openai_base_url,
+        http_client=get_openai_async_http_client(),
+        max_retries=0,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_geocoding_http_client() -> httpx.AsyncClient:
+    # Nominatim asks for an identifying User-Agent; pooled so repeat lookups reuse the TLS connection.
+    return httpx.AsyncClient(
+        headers={"User-Agent": "astrozone/1.0 (panchang)"},
+        timeout=8.0,
+        limits=httpx.Limits(max_connections=40, max_keepalive_connections=20),
+    )
+
+
+async def close_http_clients() -> None:
+    for get_client in (get_openai_async_http_client, get_geocoding_http_client, get_graph_http_client):
+        if get_client.cache_info().currsize:
+            await get_client().aclose()
+            get_client.cache_clear()
+
+
+def close_worker_pools() -> None:
+    if get_horoscope_service.cache_info().currsize:
+        get_horoscope_service().close()
+
+
+@lru_cache(maxsize=1)
+def get_otp_service() -> OTPService:
+    return OTPService()
+
+
+@lru_cache(maxsize=1)
+def get_guidance_service() -> GuidanceService:
+    return GuidanceService(get_sharepoint_client(), openai_client=get_async_openai_client())
+
+
+@lru_cache(maxsize=1)
+def get_translation_service() -> TranslationService:
+    return TranslationService(get_sharepoint_client())
+
+
+@lru_cache(maxsize=1)
+def get_zodiac_service() -> ZodiacService:
+    return ZodiacService(get_sharepoint_client())
+
+
+@lru_cache(maxsize=1)
+def get_panchang_service() -> PanchangService:
+    return PanchangService(
+        get_sharepoint_client(), openai_client=get_async_openai_client(), http_client=get_geocoding_http_client()
+    )
+
+
+@lru_cache(maxsize=1)
+def get_horoscope_service() -> HoroscopeService:
+    return HoroscopeService(get_sharepoint_client())
@@ -1,39 +1,90 @@
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI, Request, Response
+from fastapi.exception_handlers import http_exception_handler, request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from .config import settings
-from .routes import auth, guidance, preferences, profile, translations, zodiac, panchang, horoscope
 
 
-app = FastAPI(title=settings.app_name)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    from .deps import close_http_clients, close_worker_pools, get_guidance_service
+
+    await get_guidance_service().warm()
+    yield
+    await close_http_clients()
+    close_worker_pools()
+
+
+app = FastAPI(title=settings.app_name, lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:8500", "http://localhost:3000", "http://localhost:5173", "*"],
+    allow_origins=list(settings.cors_origins),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["authorization", "content-type", "x-correlation-id"],
 )
 
 
-@app.middleware("http")
-async def add_correlation_id(request: Request, call_next):
-    correlation_id = request.headers.get("x-correlation-id") or "corr-local"
-    response = await call_next(request)
-    response.headers["x-correlation-id"] = correlation_id
+def _correlation_value(request: Request) -> str:
+    return request.headers.get("x-correlation-id") or "corr-local"
+
+
+async def correlation_id(request: Request, response: Response) -> str:
+    """Echo the caller's x-correlation-id on routes that declare this dependency."""
+    value = _correlation_value(request)
+    response.headers["x-correlation-id"] = value
+    return value
+
+
+# Error responses are built outside the route, so the dependency above never touches them;
+# echo the id here so clients can still quote it when reporting a failure.
+@app.exception_handler(StarletteHTTPException)
+async def _http_exception_with_correlation(request: Request, exc: StarletteHTTPException) -> Response:
+    response = await http_exception_handler(request, exc)
+    response.headers["x-correlation-id"] = _correlation_value(request)
+    return response
+
+
+@app.exception_handler(RequestValidationError)
+async def _validation_exception_with_correlation(request: Request, exc: RequestValidationError) -> Response:
+    response = await request_validation_exception_handler(request, exc)
+    response.headers["x-correlation-id"] = _correlation_value(request)
     return response
 
 
+# Liveness probes hit this every few seconds; it deliberately skips the correlation-id dependency.
 @app.get("/healthz")
 async def healthcheck():
     return {"status": "ok", "env": settings.environment}
 
 
-app.include_router(auth.router)
-app.include_router(preferences.router)
-app.include_router(profile.router)
-app.include_router(guidance.router)
-app.include_router(translations.router)
-app.include_router(zodiac.router)
-app.include_router(panchang.router)
-app.include_router(horoscope.router)
+def _register_routers(app: FastAPI) -> None:
+    # Route modules pull in services, the SharePoint client and the OpenAI SDK; import them here
+    # rather than at module load so importing the app package alone stays cheap.
+    from .routes.auth import router as auth_router
+    from .routes.guidance import router as guidance_router
+    from .routes.horoscope import router as horoscope_router
+    from .routes.panchang import router as panchang_router
+    from .routes.preferences import router as preferences_router
+    from .routes.profile import router as profile_router
+    from .routes.translations import router as translations_router
+    from .routes.zodiac import router as zodiac_router
+
+    correlated = [Depends(correlation_id)]
+    app.include_router(auth_router, dependencies=correlated)
+    app.include_router(preferences_router, dependencies=correlated)
+    app.include_router(profile_router, dependencies=correlated)
+    app.include_router(guidance_router, dependencies=correlated)
+    app.include_router(translations_router, dependencies=correlated)
+    app.include_router(zodiac_router, dependencies=correlated)
+    app.include_router(panchang_router, dependencies=correlated)
+    app.include_router(horoscope_router, dependencies=correlated)
+
+
+_register_routers(app)
@@ -0,0 +1,2 @@
+# Serializer options shared by every typed route so they all take the same, explicit response path.
+RESPONSE_KW = {"response_model_exclude_none": False, "response_model_exclude_unset": False}
@@ -1,13 +1,20 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from ..schemas import OTPRequest, OTPResponse, OTPVerifyRequest, PreferenceSnapshot
-from ..deps import otp_service, sharepoint_client
+from . import RESPONSE_KW
+from ..schemas import OTPRequest, OTPResponse, OTPVerifyRequest
+from ..deps import get_otp_service, get_sharepoint_client
+from ..services.otp_service import OTPService
+from ..services.sharepoint_client import SharePointClientStub
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-@router.post("/request-otp", response_model=OTPResponse)
-async def request_otp(payload: OTPRequest):
+@router.post("/request-otp", response_model=OTPResponse, **RESPONSE_KW)
+async def request_otp(
+    payload: OTPRequest,
+    otp_service: OTPService = Depends(get_otp_service),
+    sharepoint_client: SharePointClientStub = Depends(get_sharepoint_client),
+):
     otp = await otp_service.generate(payload.identifier)
     await sharepoint_client.audit("otp_requested", {"identifier": payload.identifier, "channel": payload.channel})
     # In production do not return the OTP. Here we surface it for local dev/testing.
@@ -17,8 +24,12 @@ async def request_otp(payload: OTPRequest):
     )
 
 
-@router.post("/verify-otp", response_model=OTPResponse)
-async def verify_otp(payload: OTPVerifyRequest):
+@router.post("/verify-otp", response_model=OTPResponse, **RESPONSE_KW)
+async def verify_otp(
+    payload: OTPVerifyRequest,
+    otp_service: OTPService = Depends(get_otp_service),
+    sharepoint_client: SharePointClientStub = Depends(get_sharepoint_client),
+):
     is_valid = await otp_service.verify(payload.identifier, payload.otp)
     await sharepoint_client.audit("otp_verified", {"identifier": payload.identifier, "result": is_valid})
     if not is_valid:
@@ -1,36 +1,44 @@
 from datetime import date, timedelta
-from typing import Optional
+from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query
 
-from ..schemas import GuidanceBatchResponse, GuidanceResponse, PreferenceSnapshot, Profile
-from ..deps import guidance_service
+from . import RESPONSE_KW
+from ..schemas import GuidanceResponse, PeriodType, PreferenceLite, PreferenceSnapshot, Profile
+from ..deps import get_guidance_service
+from ..services.guidance_service import GuidanceService
 
 router = APIRouter(prefix="/guidance", tags=["guidance"])
 
+# Declared through Annotated so FastAPI keeps PeriodType's lowercasing validator on the query parameter.
+_PERIOD_QUERY = Query(description="Period keyword, e.g. today, tomorrow, this week, next month")
 
-@router.get("", response_model=GuidanceResponse)
+
+@router.get("", response_model=GuidanceResponse, **RESPONSE_KW)
 async def get_guidance(
     language: str = "en",
     methodology: str = "tamil",
     sign: str = Query(..., description="Zodiac sign code, e.g., ARIES"),
-    periodType: str = Query("day", description="day|week|month|year|tomorrow|today"),
+    periodType: Annotated[PeriodType, _PERIOD_QUERY] = "day",
     startDate: Optional[date] = None,
     endDate: Optional[date] = None,
     categoryBundle: Optional[str] = None,
     personalized: bool = False,
+    guidance_service: GuidanceService = Depends(get_guidance_service),
 ):
-    start = startDate or date.today()
-    if periodType.lower() == "tomorrow":
-        start = date.today() + timedelta(days=1)
+    today = date.today()
+    start = startDate or today
+    if periodType == "tomorrow":
+        start = today + timedelta(days=1)
     finish = endDate or start
 
-    preferences = PreferenceSnapshot(language=language, methodology=methodology, sign=sign)
-
     profile = None
     if personalized:
+        preferences = PreferenceSnapshot(language=language, methodology=methodology, sign=sign)
         # In MVP, caller must supply profile in a real implementation. Here we use a stub.
         profile = Profile(preferredLanguage=language, preferredMethodology=methodology, preferredSign=sign)
+    else:
+        preferences = PreferenceLite(language=language, methodology=methodology, sign=sign)
 
     response = await guidance_service.get_guidance(
         preferences=preferences,
@@ -45,10 +53,48 @@ async def get_guidance(
     return response
 
 
+@router.get("/many", response_model=List[GuidanceResponse], **RESPONSE_KW)
+async def get_guidance_many(
+    language: str = "en",
+    methodology: str = "tamil",
+    signs: List[str] = Query(..., description="Zodiac sign codes; repeat the parameter per sign"),
+    periodType: Annotated[PeriodType, _PERIOD_QUERY] = "day",
+    startDate: Optional[date] = None,
+    endDate: Optional[date] = None,
+    categoryBundle: Optional[str] = None,
+    personalized: bool = False,
+    guidance_service: GuidanceService = Depends(get_guidance_service),
+):
+    today = date.today()
+    start = startDate or today
+    if periodType == "tomorrow":
+        start = today + timedelta(days=1)
+    finish = endDate or start
+
+    profile = None
+    if personalized:
+        preferences = PreferenceSnapshot(language=language, methodology=methodology)
+        profile = Profile(preferredLanguage=language, preferredMethodology=methodology)
+    else:
+        preferences = PreferenceLite(language=language, methodology=methodology, sign=None)
+
+    return await guidance_service.get_guidance_many(
+        preferences=preferences,
+        signs=signs,
+        period_type=periodType,
+        start_date=start,
+        end_date=finish,
+        category_bundle=categoryBundle,
+        personalized=personalized,
+        profile=profile,
+    )
+
+
 @router.get("/all")
 async def get_guidance_all(
     language: str = "en",
     methodology: str = "tamil",
-    periodType: str = Query("day", description="day|week|month|year|tomorrow|today"),
+    periodType: Annotated[PeriodType, _PERIOD_QUERY] = "day",
+    guidance_service: GuidanceService = Depends(get_guidance_service),
 ):
     return await guidance_service.get_guidance_for_all(methodology=methodology, language=language, period_type=periodType)
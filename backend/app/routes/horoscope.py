@@ -1,13 +1,22 @@
-from fastapi import APIRouter, HTTPException, status
+from typing import Annotated, List
 
-from ..deps import horoscope_service
+from fastapi import APIRouter, Body, Depends, HTTPException, status
+
+from ..deps import get_horoscope_service
+from . import RESPONSE_KW
 from ..schemas import HoroscopeRequest, HoroscopeResponse
+from ..services.horoscope_service import HoroscopeService
 
 router = APIRouter(prefix="/horoscope", tags=["horoscope"])
 
+# Upper bound on charts per batch call; larger batches are rejected with 422 before any work is scheduled.
+_MAX_BATCH_CHARTS = 20
+
 
-@router.post("/generate", response_model=HoroscopeResponse)
-async def generate_horoscope(req: HoroscopeRequest):
+@router.post("/generate", response_model=HoroscopeResponse, **RESPONSE_KW)
+async def generate_horoscope(
+    req: HoroscopeRequest, horoscope_service: HoroscopeService = Depends(get_horoscope_service)
+):
     try:
         return await horoscope_service.generate(
             date=req.date, time=req.time, lat=req.lat, lon=req.lon, tz=req.tz, place_name=req.placeName, language=req.language
@@ -16,3 +25,29 @@ async def generate_horoscope(req: HoroscopeRequest):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Horoscope failed: {exc}")
+
+
+@router.post("/generate-batch", response_model=List[HoroscopeResponse], **RESPONSE_KW)
+async def generate_horoscope_batch(
+    reqs: Annotated[List[HoroscopeRequest], Body(max_length=_MAX_BATCH_CHARTS)],
+    horoscope_service: HoroscopeService = Depends(get_horoscope_service),
+):
+    try:
+        return await horoscope_service.generate_batch(
+            [
+                {
+                    "date": req.date,
+                    "time": req.time,
+                    "lat": req.lat,
+                    "lon": req.lon,
+                    "tz": req.tz,
+                    "place_name": req.placeName,
+                    "language": req.language,
+                }
+                for req in reqs
+            ]
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    except Exception as exc:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Horoscope failed: {exc}")
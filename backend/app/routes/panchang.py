@@ -1,12 +1,14 @@
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from ..deps import panchang_service
+from ..deps import get_panchang_service
+from . import RESPONSE_KW
 from ..schemas import PanchangData
+from ..services.panchang_service import PanchangService
 
 router = APIRouter(prefix="/panchang", tags=["panchang"])
 
 
-@router.get("/daily", response_model=PanchangData)
+@router.get("/daily", response_model=PanchangData, **RESPONSE_KW)
 async def daily_panchang(
     date: str = Query(..., description="YYYY-MM-DD"),
     lat: float = Query(...),
@@ -14,6 +16,7 @@ async def daily_panchang(
     tz: str = Query(..., description="IANA timezone, e.g. Asia/Kolkata"),
     locale: str | None = Query(None),
     locationName: str | None = Query(None, description="Optional resolved location name"),
+    panchang_service: PanchangService = Depends(get_panchang_service),
 ):
     try:
         return await panchang_service.get_daily_panchangam(
@@ -30,6 +33,7 @@ async def locate_timezone(
     place: str | None = Query(None, description="City/State/Country"),
     lat: float | None = Query(None),
     lon: float | None = Query(None),
+    panchang_service: PanchangService = Depends(get_panchang_service),
 ):
     data = None
     if place:
@@ -1,10 +1,11 @@
 from fastapi import APIRouter
 
+from . import RESPONSE_KW
 from ..schemas import PreferenceSnapshot, PreferencesResponse
 router = APIRouter(prefix="/preferences", tags=["preferences"])
 
 
-@router.get("/effective", response_model=PreferencesResponse)
+@router.get("/effective", response_model=PreferencesResponse, **RESPONSE_KW)
 async def get_effective_preferences(
     language: str = "en",
     methodology: str = "tamil",
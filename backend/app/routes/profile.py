@@ -1,13 +1,17 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from ..schemas import PreferenceSnapshot, Profile, ProfileResponse
-from ..deps import sharepoint_client
+from . import RESPONSE_KW
+from ..schemas import Profile, ProfileResponse
+from ..deps import get_sharepoint_client
+from ..services.sharepoint_client import SharePointClientStub
 
 router = APIRouter(prefix="/profile", tags=["profile"])
 
 
-@router.post("", response_model=ProfileResponse)
-async def upsert_profile(profile: Profile):
+@router.post("", response_model=ProfileResponse, **RESPONSE_KW)
+async def upsert_profile(
+    profile: Profile, sharepoint_client: SharePointClientStub = Depends(get_sharepoint_client)
+):
     identifier = profile.email or profile.phone or "anonymous"
     stored = await sharepoint_client.upsert_profile(identifier, profile.model_dump())
     await sharepoint_client.audit("profile_upsert", {"identifier": identifier, "profile": stored})
@@ -1,11 +1,15 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from . import RESPONSE_KW
 from ..schemas import TranslationRequest, TranslationResponse
-from ..deps import translation_service
+from ..deps import get_translation_service
+from ..services.translation_service import TranslationService
 
 router = APIRouter(prefix="/ui", tags=["translations"])
 
 
-@router.post("/translations", response_model=TranslationResponse)
-async def translate(payload: TranslationRequest):
+@router.post("/translations", response_model=TranslationResponse, **RESPONSE_KW)
+async def translate(
+    payload: TranslationRequest, translation_service: TranslationService = Depends(get_translation_service)
+):
     return await translation_service.resolve_translations(payload.keys, payload.language)
@@ -1,13 +1,18 @@
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from ..deps import zodiac_service
+from ..deps import get_zodiac_service
+from . import RESPONSE_KW
 from ..schemas import ZodiacSignListResponse
+from ..services.zodiac_service import ZodiacService
 
 router = APIRouter(prefix="/zodiac", tags=["zodiac"])
 
 
-@router.get("/signs", response_model=ZodiacSignListResponse)
-async def list_zodiac_signs(methodology: str = Query(..., description="tamil | vedic | western")):
+@router.get("/signs", response_model=ZodiacSignListResponse, **RESPONSE_KW)
+async def list_zodiac_signs(
+    methodology: str = Query(..., description="tamil | vedic | western"),
+    zodiac_service: ZodiacService = Depends(get_zodiac_service),
+):
     try:
         signs = await zodiac_service.list_signs(methodology)
     except RuntimeError as exc:
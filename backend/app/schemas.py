@@ -1,7 +1,37 @@
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Annotated, List, Literal, NamedTuple, Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, BeforeValidator, EmailStr, Field, StringConstraints
+
+OTPCode = Annotated[str, StringConstraints(min_length=6, max_length=6)]
+
+
+def _normalize_period(value: object) -> object:
+    # The period keyword has always been case- and whitespace-insensitive ("Day", " this week ").
+    return value.strip().lower() if isinstance(value, str) else value
+
+
+PeriodType = Annotated[
+    Literal[
+        "today",
+        "day",
+        "tomorrow",
+        "week",
+        "this week",
+        "current week",
+        "next week",
+        "month",
+        "this month",
+        "current month",
+        "next month",
+        "quarter",
+        "this quarter",
+        "current quarter",
+        "next quarter",
+        "year",
+    ],
+    BeforeValidator(_normalize_period),
+]
 
 
 class CorrelatedResponse(BaseModel):
@@ -15,7 +45,7 @@ class OTPRequest(BaseModel):
 
 class OTPVerifyRequest(BaseModel):
     identifier: str
-    otp: str = Field(..., min_length=6, max_length=6)
+    otp: OTPCode
 
 
 class OTPResponse(CorrelatedResponse):
@@ -28,6 +58,14 @@ class PreferenceSnapshot(BaseModel):
     sign: Optional[str] = None
 
 
+class PreferenceLite(NamedTuple):
+    """Unvalidated preference fields for internal hand-off where a PreferenceSnapshot is not needed."""
+
+    language: str
+    methodology: str
+    sign: Optional[str]
+
+
 class PreferencesResponse(CorrelatedResponse):
     preferences: PreferenceSnapshot
 
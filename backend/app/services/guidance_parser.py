@@ -1,6 +1,11 @@
-import json
+from itertools import chain
 from typing import Dict, Optional
 
+import orjson
+
+_GENERAL_CATEGORY = "general"
+_NO_GUIDANCE = "No guidance returned."
+
 
 class GuidanceParser:
     """
@@ -12,8 +17,7 @@ class GuidanceParser:
     def _clean_text_blob(text_blob: str) -> str:
         cleaned = text_blob.strip()
         if cleaned.startswith("```"):
-            cleaned = cleaned.strip("`")
-            cleaned = cleaned.replace("json", "", 1).strip()
+            cleaned = cleaned.removeprefix("```").removesuffix("```").removeprefix("json").strip()
         return cleaned
 
     @classmethod
@@ -23,54 +27,37 @@ class GuidanceParser:
         """
         if not isinstance(content, str):
             return None
+        # Strip fences up front so fenced responses are parsed once rather than failing and retrying.
+        if content.lstrip().startswith("```"):
+            content = cls._clean_text_blob(content)
         try:
-            return json.loads(content)
-        except Exception:
-            pass
-        try:
-            cleaned = cls._clean_text_blob(content)
-            return json.loads(cleaned)
-        except Exception:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
             return None
 
     @staticmethod
-    def extract_general_summaries(payload: dict, target_lang: str) -> Dict[str, str]:
+    def _general_summary(pred: dict) -> str:
+        # v2 schema can provide either `predictions` (single phase) or `timeFrames` (multi-phase);
+        # flat predictions take precedence over time frames.
+        frame_predictions = chain.from_iterable(frame.get("predictions") or [] for frame in pred.get("timeFrames") or [])
+        for p in chain(pred.get("predictions") or [], frame_predictions):
+            if (p.get("category") or "").lower() != _GENERAL_CATEGORY:
+                continue
+            if (text := p.get("summary")) or (text := p.get("prediction")):
+                return text
+        return _NO_GUIDANCE
+
+    @classmethod
+    def extract_general_summaries(cls, payload: dict, target_lang: str) -> Dict[str, str]:
         """
         Given a parsed payload (v2 schema), return {zodiacSign: general summary}.
         """
         result: Dict[str, str] = {}
-        blocks = payload.get("languageBlocks") or []
-        for block in blocks:
+        for block in payload.get("languageBlocks") or []:
             if block.get("language") != target_lang:
                 continue
-            preds = block.get("zodiacPredictions") or []
-            for pred in preds:
+            for pred in block.get("zodiacPredictions") or []:
                 code = pred.get("zodiacSign")
-                summary = "No guidance returned."
-                # v2 schema can provide either `predictions` (single phase) or `timeFrames` (multi-phase)
-                flat_predictions = pred.get("predictions") or []
-                if flat_predictions:
-                    for p in flat_predictions:
-                        if p.get("category", "").lower() == "general":
-                            if p.get("summary"):
-                                summary = p["summary"]
-                                break
-                            if p.get("prediction"):
-                                summary = p["prediction"]
-                                break
-                if summary == "No guidance returned.":
-                    frames = pred.get("timeFrames") or []
-                    for frame in frames:
-                        for p in frame.get("predictions") or []:
-                            if p.get("category", "").lower() == "general":
-                                if p.get("summary"):
-                                    summary = p["summary"]
-                                    break
-                                if p.get("prediction"):
-                                    summary = p["prediction"]
-                                    break
-                        if summary != "No guidance returned.":
-                            break
                 if code:
-                    result[code] = summary
+                    result[code] = cls._general_summary(pred)
         return result
@@ -1,10 +1,14 @@
 import calendar
-import json
+import hashlib
+import time
 from datetime import date, timedelta
 import asyncio
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
+import orjson
 from fastapi import HTTPException, status
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
 from ..config import settings
 from ..schemas import (
@@ -13,24 +17,170 @@ from ..schemas import (
     GuidanceContext,
     GuidanceGeneralItem,
     GuidanceResponse,
+    PreferenceLite,
     PreferenceSnapshot,
     Profile,
 )
 from .sharepoint_client import SharePointClientStub
+from .single_flight import SingleFlight
 
 try:
-    from openai import OpenAI
+    from openai import (
+        APIConnectionError,
+        APITimeoutError,
+        AsyncOpenAI,
+        InternalServerError,
+        RateLimitError,
+    )
+
+    _RETRYABLE_OPENAI_ERRORS: Tuple[type, ...] = (
+        RateLimitError,
+        APITimeoutError,
+        APIConnectionError,
+        InternalServerError,
+    )
 except ImportError:  # pragma: no cover
-    OpenAI = None
+    AsyncOpenAI = None
+    _RETRYABLE_OPENAI_ERRORS = ()
+
+
+_DAY_SECONDS = 60 * 60 * 24
+_TTL_SECONDS: Dict[str, int] = {
+    "today": _DAY_SECONDS,
+    "day": _DAY_SECONDS,
+    "tomorrow": _DAY_SECONDS,
+    "week": _DAY_SECONDS * 7,
+    "month": _DAY_SECONDS * 31,
+    "year": _DAY_SECONDS * 365,
+}
+# How long past its fresh TTL a long-period entry may still be served while it is regenerated.
+_STALE_SECONDS: Dict[str, int] = {
+    "month": _DAY_SECONDS * 7,
+    "year": _DAY_SECONDS * 30,
+}
+
+# Methodologies whose SharePoint lookups are preloaded at startup.
+_WARM_METHODOLOGIES = ("tamil", "vedic", "western")
+
+
+def _today_range(today: date) -> Tuple[date, date]:
+    return today, today
+
+
+def _tomorrow_range(today: date) -> Tuple[date, date]:
+    start = today + timedelta(days=1)
+    return start, start
+
+
+def _this_week_range(today: date) -> Tuple[date, date]:
+    start = today - timedelta(days=today.weekday())
+    return start, start + timedelta(days=6)
+
+
+def _next_week_range(today: date) -> Tuple[date, date]:
+    start = today - timedelta(days=today.weekday()) + timedelta(days=7)
+    return start, start + timedelta(days=6)
+
+
+def _month_bounds(year: int, month: int) -> Tuple[date, date]:
+    return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+
+
+def _this_month_range(today: date) -> Tuple[date, date]:
+    return _month_bounds(today.year, today.month)
+
+
+def _next_month_range(today: date) -> Tuple[date, date]:
+    if today.month == 12:
+        return _month_bounds(today.year + 1, 1)
+    return _month_bounds(today.year, today.month + 1)
+
+
+def _quarter_bounds(year: int, quarter: int) -> Tuple[date, date]:
+    start_month = quarter * 3 + 1
+    end_month = start_month + 2
+    return date(year, start_month, 1), date(year, end_month, calendar.monthrange(year, end_month)[1])
+
+
+def _this_quarter_range(today: date) -> Tuple[date, date]:
+    return _quarter_bounds(today.year, (today.month - 1) // 3)
+
+
+def _next_quarter_range(today: date) -> Tuple[date, date]:
+    quarter = (today.month - 1) // 3 + 1
+    if quarter >= 4:
+        return _quarter_bounds(today.year + 1, 0)
+    return _quarter_bounds(today.year, quarter)
+
+
+_PERIOD_HANDLERS: Dict[str, Callable[[date], Tuple[date, date]]] = {
+    "tomorrow": _tomorrow_range,
+    "this week": _this_week_range,
+    "week": _this_week_range,
+    "current week": _this_week_range,
+    "next week": _next_week_range,
+    "this month": _this_month_range,
+    "month": _this_month_range,
+    "current month": _this_month_range,
+    "next month": _next_month_range,
+    "this quarter": _this_quarter_range,
+    "current quarter": _this_quarter_range,
+    "quarter": _this_quarter_range,
+    "next quarter": _next_quarter_range,
+}
+
+
+def _profile_hash(profile: Profile) -> str:
+    # Hashed in-process; the digest only depends on the profile fields, so there is nothing to fetch.
+    serialized = orjson.dumps(profile.model_dump(), option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(serialized, digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=64)
+def _period_range(p: str, today: date) -> Tuple[date, date]:
+    # Pure in (period, today); memoized so repeat requests on the same day skip the calendar math.
+    return _PERIOD_HANDLERS.get(p, _today_range)(today)
 
 
 class GuidanceService:
-    def __init__(self, sharepoint: SharePointClientStub):
+    def __init__(self, sharepoint: SharePointClientStub, openai_client: Optional["AsyncOpenAI"] = None):
         self.sharepoint = sharepoint
-        self._openai_client = None
+        self._openai_client = openai_client
+        # Concurrent requests for the same cache key share one generation instead of each calling out.
+        self._inflight = SingleFlight()
+        # Cache keys with a background stale-while-revalidate refresh running, and the tasks doing it.
+        self._refreshing: Set[str] = set()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+
+    async def warm(self, methodologies: Tuple[str, ...] = _WARM_METHODOLOGIES) -> None:
+        """
+        Preload sign lists and prompt templates into the SharePoint client's lookup cache.
+        Read-only: prompt versions are resolved per request because that call may create them.
+        """
 
-    async def _build_cache_key(
-        self,
+        async def warm_one(methodology: str) -> None:
+            try:
+                await asyncio.gather(
+                    self.sharepoint.get_zodiac_signs(methodology),
+                    self.sharepoint.get_prompt_template(methodology),
+                )
+            except Exception:
+                # Warmup is best effort; a miss here is simply fetched on the first request.
+                pass
+
+        await asyncio.gather(*(warm_one(m) for m in methodologies))
+
+    async def _resolve_prompt_and_profile(
+        self, methodology: str, period_type: str, language: str, personalized: bool, profile: Optional[Profile]
+    ) -> Tuple[str, str]:
+        """Resolve the prompt version and profile hash; both feed the context and the cache key."""
+        version = await self.sharepoint.get_or_create_prompt_version(methodology, period_type, language)
+        if personalized and profile:
+            return version, _profile_hash(profile)
+        return version, "anon"
+
+    @staticmethod
+    def _compose_cache_key(
         methodology: str,
         language: str,
         sign: str,
@@ -39,27 +189,23 @@ class GuidanceService:
         end_date: date,
         category_bundle: Optional[str],
         personalized: bool,
-        profile: Optional[Profile],
+        prompt_version: str,
+        profile_hash: str,
     ) -> str:
-        profile_hash = (
-            await self.sharepoint.compute_profile_hash(profile.model_dump()) if personalized and profile else "anon"
-        )
-        prompt_version = await self.sharepoint.get_or_create_prompt_version(methodology, period_type, language)
-        bundle = category_bundle or "default"
-        return ":".join(
-            [
-                methodology,
-                language,
-                sign,
-                period_type,
-                start_date.isoformat(),
-                end_date.isoformat(),
-                bundle,
-                prompt_version,
-                "personalized" if personalized else "generic",
-                profile_hash,
-            ]
+        # Fixed-length digest of every component; the "g:" namespace keeps keys recognizable in the cache.
+        components = (
+            methodology,
+            language,
+            sign,
+            period_type,
+            start_date,
+            end_date,
+            category_bundle or "default",
+            prompt_version,
+            personalized,
+            profile_hash,
         )
+        return "g:" + hashlib.blake2b(orjson.dumps(components), digest_size=20).hexdigest()
 
     async def _fallback_generate(
         self, context: GuidanceContext, category_bundle: str, profile: Optional[Profile]
@@ -77,7 +223,7 @@ class GuidanceService:
 
     async def get_guidance(
         self,
-        preferences: PreferenceSnapshot,
+        preferences: PreferenceSnapshot | PreferenceLite,
         sign: str,
         period_type: str,
         start_date: date,
@@ -86,11 +232,11 @@ class GuidanceService:
         personalized: bool,
         profile: Optional[Profile],
     ) -> GuidanceResponse:
-        if start_date < date.today():
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Past periods are not allowed.")
-        if period_type.lower() == "year" and personalized:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Personalized yearly guidance deferred.")
+        self._validate_period(start_date, period_type, personalized)
 
+        prompt_version, profile_hash = await self._resolve_prompt_and_profile(
+            preferences.methodology, period_type, preferences.language, personalized, profile
+        )
         context = GuidanceContext(
             methodology=preferences.methodology,
             language=preferences.language,
@@ -100,12 +246,10 @@ class GuidanceService:
             endDate=end_date,
             isPersonalized=personalized,
             categoryBundle=category_bundle or "default",
-            promptVersion=await self.sharepoint.get_or_create_prompt_version(
-                preferences.methodology, period_type, preferences.language
-            ),
+            promptVersion=prompt_version,
         )
 
-        cache_key = await self._build_cache_key(
+        cache_key = self._compose_cache_key(
             methodology=context.methodology,
             language=context.language,
             sign=sign,
@@ -114,35 +258,199 @@ class GuidanceService:
             end_date=end_date,
             category_bundle=category_bundle,
             personalized=personalized,
-            profile=profile,
+            prompt_version=prompt_version,
+            profile_hash=profile_hash,
+        )
+
+        return await self._inflight.run(
+            cache_key, lambda: self._load_or_generate(context, cache_key, category_bundle, profile, period_type)
+        )
+
+    async def get_guidance_many(
+        self,
+        preferences: PreferenceSnapshot | PreferenceLite,
+        signs: List[str],
+        period_type: str,
+        start_date: date,
+        end_date: date,
+        category_bundle: Optional[str],
+        personalized: bool,
+        profile: Optional[Profile],
+    ) -> List[GuidanceResponse]:
+        """
+        Resolve guidance for several signs over the same period in one pass, one response per input
+        sign in request order (repeated signs repeat their response).
+        The prompt version and profile hash are looked up once, every sign shares one cache lookup,
+        and all misses are generated and stored together.
+        """
+        self._validate_period(start_date, period_type, personalized)
+
+        methodology = preferences.methodology
+        language = preferences.language
+        prompt_version, profile_hash = await self._resolve_prompt_and_profile(
+            methodology, period_type, language, personalized, profile
         )
 
+        contexts: Dict[str, Tuple[GuidanceContext, str]] = {}
+        for sign in dict.fromkeys(signs):
+            context = GuidanceContext(
+                methodology=methodology,
+                language=language,
+                sign=sign,
+                periodType=period_type,
+                startDate=start_date,
+                endDate=end_date,
+                isPersonalized=personalized,
+                categoryBundle=category_bundle or "default",
+                promptVersion=prompt_version,
+            )
+            cache_key = self._compose_cache_key(
+                methodology=methodology,
+                language=language,
+                sign=sign,
+                period_type=period_type,
+                start_date=start_date,
+                end_date=end_date,
+                category_bundle=category_bundle,
+                personalized=personalized,
+                prompt_version=prompt_version,
+                profile_hash=profile_hash,
+            )
+            contexts[sign] = (context, cache_key)
+
+        cached = await self.sharepoint.get_cached_guidance_many([cache_key for _, cache_key in contexts.values()])
+        by_sign: Dict[str, GuidanceResponse] = {}
+        misses: List[Tuple[GuidanceContext, str]] = []
+        for sign, (context, cache_key) in contexts.items():
+            hit = cached.get(cache_key)
+            if hit:
+                self._refresh_if_stale(hit, context, cache_key, category_bundle, profile, period_type)
+                by_sign[sign] = self._response_from_cache(hit, context)
+            else:
+                misses.append((context, cache_key))
+        if misses:
+            flight_key = ("many",) + tuple(cache_key for _, cache_key in misses)
+            generated = await self._inflight.run(
+                flight_key, lambda: self._generate_and_store_many(misses, category_bundle, profile, period_type)
+            )
+            for (context, _), response in zip(misses, generated):
+                by_sign[context.sign] = response
+        return [by_sign[sign] for sign in signs]
+
+    @staticmethod
+    def _response_from_cache(cached: dict, context: GuidanceContext) -> GuidanceResponse:
+        # Cached payloads were validated when written, so rebuild them without re-running validators.
+        categories = [GuidanceCategory.model_construct(**item) for item in cached["categories"]]
+        return GuidanceResponse.model_construct(correlationId=cached["correlationId"], context=context, categories=categories)
+
+    @staticmethod
+    def _validate_period(start_date: date, period_type: str, personalized: bool) -> None:
+        if start_date < date.today():
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Past periods are not allowed.")
+        if period_type == "year" and personalized:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Personalized yearly guidance deferred.")
+
+    async def _load_or_generate(
+        self,
+        context: GuidanceContext,
+        cache_key: str,
+        category_bundle: Optional[str],
+        profile: Optional[Profile],
+        period_type: str,
+    ) -> GuidanceResponse:
         cached = await self.sharepoint.get_cached_guidance(cache_key)
         if cached:
-            categories = [GuidanceCategory(**item) for item in cached["categories"]]
-            return GuidanceResponse(correlationId=cached["correlationId"], context=context, categories=categories)
+            self._refresh_if_stale(cached, context, cache_key, category_bundle, profile, period_type)
+            return self._response_from_cache(cached, context)
+        return await self._generate_and_store(context, cache_key, category_bundle, profile, period_type)
 
-        categories = await self._fallback_generate(context, category_bundle or "default", profile)
+    async def _generate_and_store(
+        self,
+        context: GuidanceContext,
+        cache_key: str,
+        category_bundle: Optional[str],
+        profile: Optional[Profile],
+        period_type: str,
+    ) -> GuidanceResponse:
+        responses = await self._generate_and_store_many([(context, cache_key)], category_bundle, profile, period_type)
+        return responses[0]
+
+    async def _generate_and_store_many(
+        self,
+        jobs: List[Tuple[GuidanceContext, str]],
+        category_bundle: Optional[str],
+        profile: Optional[Profile],
+        period_type: str,
+    ) -> List[GuidanceResponse]:
+        """Generate guidance for every (context, cache_key) job in one pass and store each under its own key."""
+        bundle = category_bundle or "default"
+        generated = await asyncio.gather(*(self._fallback_generate(context, bundle, profile) for context, _ in jobs))
+        # Entries outlive their fresh TTL by the stale window so they can be served while refreshing.
+        ttl_seconds = self._determine_ttl(period_type) + self._determine_stale_window(period_type)
+        generated_at = time.time()
+        responses: List[GuidanceResponse] = []
+        for (context, cache_key), categories in zip(jobs, generated):
+            payload = {
+                "correlationId": cache_key,
+                "categories": [c.model_dump() for c in categories],
+                "generatedAt": generated_at,
+            }
+            await self.sharepoint.put_cached_guidance(cache_key, payload, ttl_seconds=ttl_seconds)
+            responses.append(GuidanceResponse(correlationId=cache_key, context=context, categories=categories))
+        return responses
+
+    def _refresh_if_stale(
+        self,
+        cached: dict,
+        context: GuidanceContext,
+        cache_key: str,
+        category_bundle: Optional[str],
+        profile: Optional[Profile],
+        period_type: str,
+    ) -> None:
+        """
+        Stale-while-revalidate: a hit older than its fresh TTL is still served, and one background
+        regeneration per key replaces it. Payloads without generatedAt are treated as fresh.
+        """
+        generated_at = cached.get("generatedAt")
+        if generated_at is None or cache_key in self._refreshing:
+            return
+        if time.time() - generated_at < self._determine_ttl(period_type):
+            return
 
-        payload = {
-            "correlationId": cache_key,
-            "categories": [c.model_dump() for c in categories],
-        }
-        ttl_seconds = self._determine_ttl(period_type)
-        await self.sharepoint.put_cached_guidance(cache_key, payload, ttl_seconds=ttl_seconds)
-        return GuidanceResponse(correlationId=cache_key, context=context, categories=categories)
+        async def refresh() -> None:
+            try:
+                # Own key: the request that spotted the stale hit may still be the flight leader for
+                # cache_key, and joining it would just hand back the stale response.
+                await self._inflight.run(
+                    ("refresh", cache_key),
+                    lambda: self._generate_and_store(context, cache_key, category_bundle, profile, period_type),
+                )
+            except Exception:
+                # The stale entry keeps being served until it expires; the next hit retries the refresh.
+                pass
+            finally:
+                self._refreshing.discard(cache_key)
+
+        self._refreshing.add(cache_key)
+        task = asyncio.create_task(refresh())
+        # Hold a reference so the task is not garbage collected before it finishes.
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    @staticmethod
+    def _sign_prompt_names(signs: List[dict]) -> Tuple[Tuple[str, ...], str]:
+        """Sign codes and the comma-joined English names sent to OpenAI."""
+        codes = tuple(s["code"] for s in signs)
+        # Always use English names when sending to OpenAI
+        prompt_names = ",".join(s.get("english") or s.get("displayName") or s["code"] for s in signs)
+        return codes, prompt_names
 
     def _determine_ttl(self, period_type: str) -> int:
-        period = period_type.lower()
-        if period in ("today", "day", "tomorrow"):
-            return 60 * 60 * 24
-        if period == "week":
-            return 60 * 60 * 24 * 7
-        if period == "month":
-            return 60 * 60 * 24 * 31
-        if period == "year":
-            return 60 * 60 * 24 * 365
-        return 60 * 60 * 24
+        return _TTL_SECONDS.get(period_type.lower(), _DAY_SECONDS)
+
+    def _determine_stale_window(self, period_type: str) -> int:
+        return _STALE_SECONDS.get(period_type.lower(), 0)
 
     def _compute_period_range(self, period_type: str) -> Tuple[date, date]:
         """
@@ -150,65 +458,20 @@ class GuidanceService:
         today, tomorrow, this week, next week, this month, next month.
         Defaults to today on unknown input.
         """
-        p = (period_type or "today").strip().lower()
-        today = date.today()
-
-        if p == "tomorrow":
-            start = today + timedelta(days=1)
-            end = start
-        elif p in ("this week", "week", "current week"):
-            start = today - timedelta(days=today.weekday())
-            end = start + timedelta(days=6)
-        elif p == "next week":
-            start = today - timedelta(days=today.weekday()) + timedelta(days=7)
-            end = start + timedelta(days=6)
-        elif p in ("this month", "month", "current month"):
-            start = today.replace(day=1)
-            last_day = calendar.monthrange(today.year, today.month)[1]
-            end = today.replace(day=last_day)
-        elif p == "next month":
-            if today.month == 12:
-                year = today.year + 1
-                month = 1
-            else:
-                year = today.year
-                month = today.month + 1
-            start = date(year, month, 1)
-            last_day = calendar.monthrange(year, month)[1]
-            end = date(year, month, last_day)
-        elif p in ("this quarter", "current quarter", "quarter"):
-            quarter = (today.month - 1) // 3
-            start_month = quarter * 3 + 1
-            start = date(today.year, start_month, 1)
-            end_month = start_month + 2
-            end_day = calendar.monthrange(today.year, end_month)[1]
-            end = date(today.year, end_month, end_day)
-        elif p == "next quarter":
-            quarter = (today.month - 1) // 3 + 1
-            year = today.year
-            if quarter >= 4:
-                quarter = 0
-                year += 1
-            start_month = quarter * 3 + 1
-            start = date(year, start_month, 1)
-            end_month = start_month + 2
-            end_day = calendar.monthrange(year, end_month)[1]
-            end = date(year, end_month, end_day)
-        else:
-            start = today
-            end = today
-
-        return start, end
+        return _period_range((period_type or "today").strip().lower(), date.today())
 
     async def get_guidance_for_all(self, methodology: str, language: str, period_type: str):
-        signs = await self.sharepoint.get_zodiac_signs(methodology)
+        # The sign list and prompt template are independent SharePoint reads; fetch them concurrently.
+        signs, prompt = await asyncio.gather(
+            self.sharepoint.get_zodiac_signs(methodology),
+            self.sharepoint.get_prompt_template(methodology),
+        )
         if not signs:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No zodiac signs available for the specified methodology.",
             )
 
-        prompt = await self.sharepoint.get_prompt_template(methodology)
         if not prompt or not prompt.get("active"):
             raise HTTPException(
                 status_code=status.HTTP_502_BAD_GATEWAY,
@@ -222,24 +485,45 @@ class GuidanceService:
                 detail="No prompt identifier found for the requested methodology.",
             )
 
-        sign_codes = [s["code"] for s in signs]
-        # Always use English names when sending to OpenAI
-        sign_prompt_names: List[str] = []
-        for s in signs:
-            if s.get("english"):
-                sign_prompt_names.append(s["english"])
-            elif s.get("displayName"):
-                sign_prompt_names.append(s["displayName"])
-            else:
-                sign_prompt_names.append(s["code"])
+        sign_codes, zodiac_signs = self._sign_prompt_names(signs)
 
         start_dt, end_dt = self._compute_period_range(period_type)
         start_date = start_dt.isoformat()
         end_date = end_dt.isoformat()
-        # Title is stored but not used for filtering; omit language to avoid cache misses.
+        # Title (the period type) is part of the stored row key; language is omitted to avoid cache misses.
         title = period_type
-        zodiac_signs = ",".join(sign_prompt_names)
 
+        flight_key = ("batch", methodology, title, start_date, end_date, zodiac_signs)
+        raw_content = await self._inflight.run(
+            flight_key,
+            lambda: self._load_or_generate_batch(
+                sign_codes=sign_codes,
+                language=language,
+                methodology=methodology,
+                prompt_id=prompt_id,
+                period_type=period_type,
+                title=title,
+                start_date=start_date,
+                end_date=end_date,
+                zodiac_signs=zodiac_signs,
+            ),
+        )
+        if raw_content is None:
+            return {"detail": "No guidance returned."}
+        return raw_content
+
+    async def _load_or_generate_batch(
+        self,
+        sign_codes: Tuple[str, ...],
+        language: str,
+        methodology: str,
+        prompt_id: str,
+        period_type: str,
+        title: str,
+        start_date: str,
+        end_date: str,
+        zodiac_signs: str,
+    ) -> Optional[object]:
         cached = await self.sharepoint.get_cached_guidance_batch(
             methodology=methodology, title=title, start_date=start_date, end_date=end_date, zodiac_signs=zodiac_signs
         )
@@ -249,14 +533,14 @@ class GuidanceService:
             raw_content = cached
             if isinstance(raw_content, str):
                 try:
-                    raw_content = json.loads(raw_content)
-                except Exception:
+                    raw_content = orjson.loads(raw_content)
+                except orjson.JSONDecodeError:
                     # leave as string if parsing fails
                     pass
         else:
             _, raw_content = await self._invoke_openai_agent_batch(
                 sign_codes=sign_codes,
-                sign_prompt_names=sign_prompt_names,
+                zodiac_signs=zodiac_signs,
                 language=language,
                 methodology=methodology,
                 prompt_id=prompt_id,
@@ -275,18 +559,15 @@ class GuidanceService:
             )
             if isinstance(raw_content, str):
                 try:
-                    raw_content = json.loads(raw_content)
-                except Exception:
+                    raw_content = orjson.loads(raw_content)
+                except orjson.JSONDecodeError:
                     pass
-
-        if raw_content is None:
-            return {"detail": "No guidance returned."}
         return raw_content
 
     async def _invoke_openai_agent_batch(
         self,
-        sign_codes: List[str],
-        sign_prompt_names: List[str],
+        sign_codes: Tuple[str, ...],
+        zodiac_signs: str,
         language: str,
         methodology: str,
         prompt_id: str,
@@ -294,7 +575,7 @@ class GuidanceService:
         start_date: str,
         end_date: str,
     ) -> Tuple[Dict[str, str], Optional[str]]:
-        if OpenAI is None or not settings.openai_api_key:
+        if self._openai_client is None:
             base = {
                 "en": "General guidance",
                 "ta": "General guidance",
@@ -303,12 +584,9 @@ class GuidanceService:
             summaries = {code: f"{base} for {code} using {methodology}." for code in sign_codes}
             return summaries, None
 
-        if self._openai_client is None:
-            self._openai_client = OpenAI(api_key=settings.openai_api_key, base_url=settings.openai_base_url)
-
         user_content = (
             f"HOROSCOPE_METHOD={methodology}. START_DATE={start_date}. END_DATE={end_date}. "
-            f"ZODIAC_SIGNS={','.join(sign_prompt_names)}. "
+            f"ZODIAC_SIGNS={zodiac_signs}. "
             "Respond with json."
         )
 
@@ -318,8 +596,16 @@ class GuidanceService:
                 detail="OpenAI client does not support responses API. Please upgrade backend openai package.",
             )
 
-        def call_openai():
-            return self._openai_client.responses.create(
+        # Only transient failures (rate limits, timeouts, dropped connections, 5xx) are retried, with
+        # jittered exponential backoff so concurrent callers do not retry in lockstep.
+        @retry(
+            wait=wait_random_exponential(multiplier=0.3, max=4),
+            stop=stop_after_attempt(3),
+            retry=retry_if_exception_type(_RETRYABLE_OPENAI_ERRORS),
+            reraise=True,
+        )
+        async def _do_call():
+            return await self._openai_client.responses.create(
                 model=settings.openai_model,
                 prompt={"id": prompt_id},
                 input=[
@@ -331,21 +617,14 @@ class GuidanceService:
                 text={"format": {"type": "json_object"}},
             )
 
-        attempt = 0
-        response = None
-        while attempt < 2 and response is None:
-            try:
-                response = await asyncio.to_thread(call_openai)
-            except Exception as exc:
-                attempt += 1
-                if attempt < 2:
-                    await asyncio.sleep(0.5)
-                else:
-                    req_id = getattr(exc, "request_id", None)
-                    raise HTTPException(
-                        status_code=status.HTTP_502_BAD_GATEWAY,
-                        detail=f"OpenAI responses.create failed (req_id={req_id}): {exc}",
-                    ) from exc
+        try:
+            response = await _do_call()
+        except Exception as exc:
+            req_id = getattr(exc, "request_id", None)
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=f"OpenAI responses.create failed (req_id={req_id}): {exc}",
+            ) from exc
 
         content: Optional[str] = None
         try:
@@ -1,7 +1,14 @@
+import asyncio
+import threading
 import uuid
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache, partial
+from time import monotonic
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from .sharepoint_client import SharePointClientStub
 
@@ -10,6 +17,206 @@ try:
 except Exception:  # pragma: no cover
     swe = None
 
+if swe is not None:
+    _EPHE_FLAGS = swe.FLG_SWIEPH | swe.FLG_SIDEREAL
+    # Ketu is not looked up: it is always 180 deg from Rahu (Mean Node).
+    _BODIES = (
+        ("Sun", swe.SUN),
+        ("Moon", swe.MOON),
+        ("Mercury", swe.MERCURY),
+        ("Venus", swe.VENUS),
+        ("Mars", swe.MARS),
+        ("Jupiter", swe.JUPITER),
+        ("Saturn", swe.SATURN),
+        ("Rahu", swe.MEAN_NODE),
+    )
+else:  # pragma: no cover
+    _EPHE_FLAGS = 0
+    _BODIES = ()
+
+_UTC = ZoneInfo("UTC")
+_RESPONSE_TTL_SECONDS = 60 * 60
+_RESPONSE_CACHE_CAP = 2048
+_EPHE_LOCK = threading.Lock()
+
+# Localized labels, one table per language; supported languages are en, ta and hi.
+_RASI_NAMES = {
+    "en": (
+        "Mesha",
+        "Vrishabha",
+        "Mithuna",
+        "Karka",
+        "Simha",
+        "Kanya",
+        "Tula",
+        "Vrishchika",
+        "Dhanu",
+        "Makara",
+        "Kumbha",
+        "Meena",
+    ),
+    "ta": (
+        "மேஷம்",
+        "ரிஷபம்",
+        "மிதுனம்",
+        "கடகம்",
+        "சிம்மம்",
+        "கன்னி",
+        "துலாம்",
+        "விருச்சிகம்",
+        "தனுசு",
+        "மகரம்",
+        "கும்பம்",
+        "மீனம்",
+    ),
+    "hi": (
+        "मेष",
+        "वृषभ",
+        "मिथुन",
+        "कर्क",
+        "सिंह",
+        "कन्या",
+        "तुला",
+        "वृश्चिक",
+        "धनु",
+        "मकर",
+        "कुंभ",
+        "मीन",
+    ),
+}
+_RASI_ABBR = {
+    "en": ("Ar", "Ta", "Ge", "Ca", "Le", "Vi", "Li", "Sc", "Sg", "Cp", "Aq", "Pi"),
+    "ta": ("மே", "ரி", "மி", "க", "சி", "கந்", "து", "வி", "த", "ம", "கு", "மீ"),
+    "hi": ("मे", "वृ", "मि", "क", "सिं", "कन", "तु", "वृश", "ध", "मक", "कुं", "मीन"),
+}
+_PLANET_ABBR = {
+    "en": {
+        "Sun": "Su",
+        "Moon": "Mo",
+        "Mercury": "Me",
+        "Venus": "Ve",
+        "Mars": "Ma",
+        "Jupiter": "Ju",
+        "Saturn": "Sa",
+        "Rahu": "Ra",
+        "Ketu": "Ke",
+        "Ascendant": "Asc",
+    },
+    "ta": {
+        "Sun": "சூ",
+        "Moon": "சந்",
+        "Mercury": "பு",
+        "Venus": "வி",
+        "Mars": "செ",
+        "Jupiter": "கு",
+        "Saturn": "சன",
+        "Rahu": "ரா",
+        "Ketu": "கே",
+        "Ascendant": "லக",
+    },
+    "hi": {
+        "Sun": "सू",
+        "Moon": "चं",
+        "Mercury": "बु",
+        "Venus": "शु",
+        "Mars": "मं",
+        "Jupiter": "गु",
+        "Saturn": "श",
+        "Rahu": "रा",
+        "Ketu": "के",
+        "Ascendant": "लग",
+    },
+}
+_WEEKDAYS = {
+    "en": ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"),
+    "ta": ("திங்கள்", "செவ்வாய்", "புதன்", "வியாழன்", "வெள்ளி", "சனி", "ஞாயிறு"),
+    "hi": ("सोमवार", "मंगलवार", "बुधवार", "गुरुवार", "शुक्रवार", "शनिवार", "रविवार"),
+}
+_DETAIL_LABELS = {
+    "en": {
+        "Ascendant": "Ascendant",
+        "Ascendant Lord": "Ascendant Lord",
+        "Nakshatra": "Nakshatra",
+        "Nakshatra Lord": "Nakshatra Lord",
+        "Weekday": "Weekday",
+        "Rasi": "Rasi",
+        "Rasi Lord": "Rasi Lord",
+    },
+    "ta": {
+        "Ascendant": "லக்கணம்",
+        "Ascendant Lord": "லக்கண அதிபதி",
+        "Nakshatra": "நட்சத்திரம்",
+        "Nakshatra Lord": "நட்சத்திர அதிபதி",
+        "Weekday": "கிழமை",
+        "Rasi": "ராசி",
+        "Rasi Lord": "ராசி அதிபதி",
+    },
+    "hi": {
+        "Ascendant": "लग्न",
+        "Ascendant Lord": "लग्नेश",
+        "Nakshatra": "नक्षत्र",
+        "Nakshatra Lord": "नक्षत्र स्वामी",
+        "Weekday": "वार",
+        "Rasi": "राशि",
+        "Rasi Lord": "राशि स्वामी",
+    },
+}
+
+# Lord of each rasi, indexed like the rasi tables.
+_RASI_LORDS = ("Mars", "Venus", "Mercury", "Moon", "Sun", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Saturn", "Jupiter")
+
+# Navamsa counting starts from Mesha for movable signs, Simha for fixed and Dhanu for dual.
+_NAVAMSA_START = (0, 4, 8) * 4
+
+# Vimshottari dasha sequence and period lengths in years; each bhukti takes its lord's share of 120 years.
+_DASHA_ORDER = ("Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury")
+_DASHA_YEARS = {"Ketu": 7, "Venus": 20, "Sun": 6, "Moon": 10, "Mars": 7, "Rahu": 18, "Jupiter": 16, "Saturn": 19, "Mercury": 17}
+_BHUKTI_SHARES = tuple(_DASHA_YEARS[lord] / 120.0 for lord in _DASHA_ORDER)
+
+
+@lru_cache(maxsize=1024)
+def _compute_chart_raw(jd: float, lat: float, lon: float) -> Tuple[float, Tuple[Tuple[str, float], ...]]:
+    """
+    Sidereal ascendant and (planet, longitude) pairs for a Julian day and place.
+    Language-independent, so every localized rendering of the same chart shares one result.
+    """
+    # The sidereal mode is process-global ephemeris state, so charts are computed one at a time.
+    with _EPHE_LOCK:
+        swe.set_sid_mode(swe.SIDM_LAHIRI)
+        # Ascendant via whole-sign houses
+        _, ascmc = swe.houses_ex(jd, lat, lon, b"W")
+        # pyswisseph >= 2.0 returns ((lon, lat, dist, ...), retflag).
+        longitudes = {name: swe.calc_ut(jd, code, _EPHE_FLAGS)[0][0] for name, code in _BODIES}
+    longitudes["Ketu"] = (longitudes["Rahu"] + 180) % 360
+    return ascmc[0], tuple(longitudes.items())
+
+
+@dataclass(slots=True)
+class Placement:
+    planet: str
+    lon: float
+    position: str
+    degree: str
+    rasi: str
+    rasi_en: str
+    rasi_lord: str
+    nakshatra: str
+    nakshatra_lord: str
+    raw_planet: Optional[str] = None
+    pada: Optional[int] = None
+
+    def to_position(self) -> Dict[str, str]:
+        """The planetPositions entry returned to clients."""
+        return {
+            "planet": self.planet,
+            "position": self.position,
+            "degree": self.degree,
+            "rasi": self.rasi,
+            "rasiLord": self.rasi_lord,
+            "nakshatra": self.nakshatra,
+            "nakshatraLord": self.nakshatra_lord,
+        }
+
 
 class HoroscopeService:
     """
@@ -20,20 +227,13 @@ class HoroscopeService:
 
     def __init__(self, sharepoint: SharePointClientStub):
         self.sharepoint = sharepoint
-        self.rasi_names = [
-            "Mesha",
-            "Vrishabha",
-            "Mithuna",
-            "Karka",
-            "Simha",
-            "Kanya",
-            "Tula",
-            "Vrishchika",
-            "Dhanu",
-            "Makara",
-            "Kumbha",
-            "Meena",
-        ]
+        # Keeps chart generation off the event loop. Ephemeris calls are serialized by _EPHE_LOCK and the
+        # rest is GIL-bound Python, so a second worker only overlaps one chart's formatting with the next.
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="horoscope")
+        # Rendered responses (minus correlationId) keyed by request inputs; a bounded LRU with a TTL,
+        # kept apart from the guidance cache so charts never evict guidance entries.
+        self._responses: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.rasi_names = _RASI_NAMES["en"]
         self.nakshatra_names = [
             "Ashwini",
             "Bharani",
@@ -64,44 +264,33 @@ class HoroscopeService:
             "Revati",
         ]
         # Lord sequence per dasha order for nakshatra
-        self.nakshatra_lords = ["Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury"]
-        self.rasi_lords = {
-            "Mesha": "Mars",
-            "Vrishabha": "Venus",
-            "Mithuna": "Mercury",
-            "Karka": "Moon",
-            "Simha": "Sun",
-            "Kanya": "Mercury",
-            "Tula": "Venus",
-            "Vrishchika": "Mars",
-            "Dhanu": "Jupiter",
-            "Makara": "Saturn",
-            "Kumbha": "Saturn",
-            "Meena": "Jupiter",
-        }
+        self.nakshatra_lords = _DASHA_ORDER
+        self.rasi_lords = dict(zip(self.rasi_names, _RASI_LORDS))
+
+    def close(self) -> None:
+        """Stop the chart worker pool; called on application shutdown."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
 
     def _require_ephemeris(self):
         if swe is None:
             raise ValueError("Swiss Ephemeris (pyswisseph) not installed in container.")
 
-    def _parse_datetime(self, date_str: str, time_str: str, tz: str) -> Tuple[datetime, float]:
+    def _parse_datetime(self, date_str: str, time_str: str, tz: str) -> Tuple[datetime, float, ZoneInfo]:
         try:
-            hh, mm, *rest = time_str.split(":")
-            ss = int(rest[0]) if rest else 0
-            local_dt = datetime(
-                int(date_str.split("-")[0]),
-                int(date_str.split("-")[1]),
-                int(date_str.split("-")[2]),
-                int(hh),
-                int(mm),
-                ss,
-                tzinfo=ZoneInfo(tz),
-            )
+            local_tz = ZoneInfo(tz)
+            try:
+                # Fast path for what the frontend sends: YYYY-MM-DD and HH:MM or HH:MM:SS.
+                local_dt = datetime.combine(date.fromisoformat(date_str), time.fromisoformat(time_str), tzinfo=local_tz)
+            except ValueError:
+                # Unpadded input such as "9:30" or "2024-1-5" has always been accepted; parse it field by field.
+                year, month, day = (int(part) for part in date_str.split("-"))
+                hh, mm, *rest = time_str.split(":")
+                local_dt = datetime(year, month, day, int(hh), int(mm), int(rest[0]) if rest else 0, tzinfo=local_tz)
         except ZoneInfoNotFoundError as exc:
             raise ValueError(f"Invalid timezone: {tz}") from exc
-        dt_utc = local_dt.astimezone(ZoneInfo("UTC"))
+        dt_utc = local_dt.astimezone(_UTC)
         hour_decimal = dt_utc.hour + dt_utc.minute / 60 + dt_utc.second / 3600
-        return dt_utc, hour_decimal
+        return dt_utc, hour_decimal, local_tz
 
     def _nakshatra(self, lon: float) -> Tuple[str, str, int]:
         span = 360 / 27
@@ -112,220 +301,149 @@ class HoroscopeService:
         return self.nakshatra_names[idx], lord, pada
 
     def _rasi_label(self, idx: int, lang: str, short: bool = False) -> str:
-        base_en = self.rasi_names[idx]
-        if lang == "ta":
-            tamil = [
-                "மேஷம்",
-                "ரிஷபம்",
-                "மிதுனம்",
-                "கடகம்",
-                "சிம்மம்",
-                "கன்னி",
-                "துலாம்",
-                "விருச்சிகம்",
-                "தனுசு",
-                "மகரம்",
-                "கும்பம்",
-                "மீனம்",
-            ]
-            abbr = ["மே", "ரி", "மி", "க", "சி", "கந்", "து", "வி", "த", "ம", "கு", "மீ"]
-            return abbr[idx] if short else tamil[idx]
-        if lang == "hi":
-            hindi = [
-                "मेष",
-                "वृषभ",
-                "मिथुन",
-                "कर्क",
-                "सिंह",
-                "कन्या",
-                "तुला",
-                "वृश्चिक",
-                "धनु",
-                "मकर",
-                "कुंभ",
-                "मीन",
-            ]
-            abbr = ["मे", "वृ", "मि", "क", "सिं", "कन", "तु", "वृश", "ध", "मक", "कुं", "मीन"]
-            return abbr[idx] if short else hindi[idx]
-        # English
-        abbr_en = ["Ar", "Ta", "Ge", "Ca", "Le", "Vi", "Li", "Sc", "Sg", "Cp", "Aq", "Pi"]
-        return abbr_en[idx] if short else base_en
+        return (_RASI_ABBR if short else _RASI_NAMES)[lang][idx]
 
     def _planet_label(self, name: str, lang: str) -> str:
-        if lang == "ta":
-            mapping = {
-                "Sun": "சூ",
-                "Moon": "சந்",
-                "Mercury": "பு",
-                "Venus": "வி",
-                "Mars": "செ",
-                "Jupiter": "கு",
-                "Saturn": "சன",
-                "Rahu": "ரா",
-                "Ketu": "கே",
-                "Ascendant": "லக",
-            }
-            return mapping.get(name, name[:3])
-        if lang == "hi":
-            mapping = {
-                "Sun": "सू",
-                "Moon": "चं",
-                "Mercury": "बु",
-                "Venus": "शु",
-                "Mars": "मं",
-                "Jupiter": "गु",
-                "Saturn": "श",
-                "Rahu": "रा",
-                "Ketu": "के",
-                "Ascendant": "लग",
-            }
-            return mapping.get(name, name[:3])
-        abbr = {
-            "Sun": "Su",
-            "Moon": "Mo",
-            "Mercury": "Me",
-            "Venus": "Ve",
-            "Mars": "Ma",
-            "Jupiter": "Ju",
-            "Saturn": "Sa",
-            "Rahu": "Ra",
-            "Ketu": "Ke",
-            "Ascendant": "Asc",
-        }
-        return abbr.get(name, name[:3])
+        return _PLANET_ABBR[lang].get(name, name[:3])
 
     def _navamsa_rasi(self, lon: float, rasi_index: int) -> int:
-        # Navamsa rules by modality
-        modalities = ["movable", "fixed", "dual", "movable", "fixed", "dual", "movable", "fixed", "dual", "movable", "fixed", "dual"]
-        modality = modalities[rasi_index]
-        start_sign = {"movable": 0, "fixed": 4, "dual": 8}[modality]
-        part = int((lon % 30) // (30 / 9))
-        return (start_sign + part) % 12
+        # Navamsa rules by modality; each sign holds nine 3deg20' parts, i.e. 0.3 parts per degree.
+        part = int((lon - rasi_index * 30) * 0.3)
+        return (_NAVAMSA_START[rasi_index] + part) % 12
 
     def _format_deg(self, lon: float) -> str:
-        deg = int(lon)
-        minutes_full = (lon - deg) * 60
-        minutes = int(minutes_full)
-        seconds = int((minutes_full - minutes) * 60)
+        deg, rem = divmod(int(lon * 3600), 3600)
+        minutes, seconds = divmod(rem, 60)
         return f"{deg}° {minutes:02d}' {seconds:02d}″"
 
     async def generate(
         self, *, date: str, time: str, lat: float, lon: float, tz: str, place_name: str | None = None, language: str = "en"
     ) -> Dict[str, Any]:
-        supported_langs = {"en", "ta", "hi"}
+        # The whole response except correlationId is deterministic in the inputs, so share it across callers.
+        cache_key = (date, time, round(lat, 6), round(lon, 6), tz, place_name, (language or "en").lower())
+        cached = self._cached_response(cache_key)
+        if cached is None:
+            # Chart computation is pure CPU work; run it off the event loop so other requests keep flowing.
+            cached = await asyncio.get_running_loop().run_in_executor(
+                self._pool,
+                partial(
+                    self._generate_sync, date=date, time=time, lat=lat, lon=lon, tz=tz, place_name=place_name, language=language
+                ),
+            )
+            self._store_response(cache_key, cached)
+        return {**cached, "correlationId": str(uuid.uuid4())}
+
+    def _cached_response(self, cache_key: Tuple) -> Optional[Dict[str, Any]]:
+        entry = self._responses.get(cache_key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at <= monotonic():
+            del self._responses[cache_key]
+            return None
+        self._responses.move_to_end(cache_key)
+        return response
+
+    def _store_response(self, cache_key: Tuple, response: Dict[str, Any]) -> None:
+        self._responses[cache_key] = (monotonic() + _RESPONSE_TTL_SECONDS, response)
+        self._responses.move_to_end(cache_key)
+        if len(self._responses) > _RESPONSE_CACHE_CAP:
+            self._responses.popitem(last=False)
+
+    async def generate_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Generate several charts; each item takes the same keyword arguments as generate().
+        Cached charts return immediately; the rest queue on the service's worker pool.
+        """
+        return await asyncio.gather(*(self.generate(**req) for req in requests))
+
+    def _generate_sync(
+        self, *, date: str, time: str, lat: float, lon: float, tz: str, place_name: str | None, language: str
+    ) -> Dict[str, Any]:
         lang = (language or "en").lower()
-        if lang not in supported_langs:
+        if lang not in _RASI_NAMES:
             raise ValueError(f"Unsupported language: {language}")
         self._require_ephemeris()
-        swe.set_sid_mode(swe.SIDM_LAHIRI)
+        # Resolve the language's label tables once; lookups below are plain indexing.
+        rasi_of = _RASI_NAMES[lang]
+        planet_of = _PLANET_ABBR[lang]
 
-        dt_utc, hour_decimal = self._parse_datetime(date, time, tz)
+        dt_utc, hour_decimal, local_tz = self._parse_datetime(date, time, tz)
         jd = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, hour_decimal)
 
-        # Ascendant via whole-sign houses
-        house_cusps, ascmc = swe.houses_ex(jd, lat, lon, b"W")
-        asc_lon = ascmc[0]
-
-        planets = {
-            "Sun": swe.SUN,
-            "Moon": swe.MOON,
-            "Mercury": swe.MERCURY,
-            "Venus": swe.VENUS,
-            "Mars": swe.MARS,
-            "Jupiter": swe.JUPITER,
-            "Saturn": swe.SATURN,
-            "Rahu": swe.MEAN_NODE,
-            "Ketu": swe.MEAN_NODE,
-        }
+        # Rounded so repeat requests for the same chart hit the cache (~0.1 ms / ~0.1 m granularity).
+        asc_lon, body_longitudes = _compute_chart_raw(round(jd, 9), round(lat, 6), round(lon, 6))
+        longitudes = dict(body_longitudes)
 
-        def _calc_lon(body: int) -> float:
-            res = swe.calc_ut(jd, body, swe.FLG_SWIEPH | swe.FLG_SIDEREAL)
-            if isinstance(res, tuple) and len(res) == 2 and isinstance(res[0], (list, tuple)):
-                return float(res[0][0])
-            if isinstance(res, (list, tuple)) and len(res) >= 1:
-                return float(res[0])
-            raise ValueError("Swiss ephemeris calculation failed.")
-
-        placements: List[Dict[str, Any]] = []
+        placements: List[Placement] = []
+        # Response projection, filled in the same pass as placements.
+        planet_positions: List[Dict[str, str]] = []
+        # (sign index, label) per body, collected alongside placements for the rasi and navamsa charts.
+        rasi_bodies: List[Tuple[int, str]] = []
+        navamsa_bodies: List[Tuple[int, str]] = []
         moon_lord = None
-        moon_lon = None
-        moon_pada = None
-        for name, code in planets.items():
-            if name == "Ketu":
-                # Ketu is 180 deg apart from Rahu (Mean Node)
-                base = next((p for p in placements if p["planet"] == "Rahu"), None)
-                if not base:
-                    lon_sid = _calc_lon(code)
-                else:
-                    lon_sid = (base["lon"] + 180) % 360
-            else:
-                lon_sid = _calc_lon(code)
-                if name == "Moon":
-                    moon_lon = lon_sid
+        moon_lon = longitudes["Moon"]
+        for name, lon_sid in longitudes.items():
             rasi_idx = int(lon_sid // 30)
             rasi_name_en = self.rasi_names[rasi_idx]
-            rasi_name = self._rasi_label(rasi_idx, lang, short=False)
-            nak_name, nak_lord, _ = self._nakshatra(lon_sid)
+            rasi_name = rasi_of[rasi_idx]
+            nak_name, nak_lord, pada = self._nakshatra(lon_sid)
             if name == "Moon":
                 moon_lord = nak_lord
-            planet_label = self._planet_label(name, lang)
-            placements.append(
-                {
-                    "planet": planet_label,
-                    "lon": lon_sid,
-                    "position": self._format_deg(lon_sid),
-                    "degree": self._format_deg(lon_sid % 30),
-                    "rasi": rasi_name,
-                    "rasi_en": rasi_name_en,
-                    "rasiLord": self.rasi_lords.get(rasi_name_en, ""),
-                    "nakshatra": nak_name,
-                    "nakshatraLord": nak_lord,
-                    "rawPlanet": name,
-                    "pada": moon_pada if name == "Moon" else None,
-                }
+            planet_label = planet_of[name]
+            rasi_bodies.append((rasi_idx, planet_label))
+            navamsa_bodies.append((self._navamsa_rasi(lon_sid, rasi_idx), planet_label))
+            placement = Placement(
+                planet=planet_label,
+                lon=lon_sid,
+                position=self._format_deg(lon_sid),
+                degree=self._format_deg(lon_sid % 30),
+                rasi=rasi_name,
+                rasi_en=rasi_name_en,
+                rasi_lord=_RASI_LORDS[rasi_idx],
+                nakshatra=nak_name,
+                nakshatra_lord=nak_lord,
+                raw_planet=name,
+                pada=pada if name == "Moon" else None,
             )
+            placements.append(placement)
+            planet_positions.append(placement.to_position())
 
         asc_rasi_idx = int(asc_lon // 30)
         asc_rasi_name_en = self.rasi_names[asc_rasi_idx]
-        asc_rasi_name = self._rasi_label(asc_rasi_idx, lang, short=False)
-        placements.append(
-            {
-                "planet": self._planet_label("Ascendant", lang),
-                "lon": asc_lon,
-                "position": self._format_deg(asc_lon),
-                "degree": self._format_deg(asc_lon % 30),
-                "rasi": asc_rasi_name,
-                "rasi_en": asc_rasi_name_en,
-                "rasiLord": self.rasi_lords.get(asc_rasi_name_en, ""),
-                "nakshatra": self._nakshatra(asc_lon)[0],
-                "nakshatraLord": self._nakshatra(asc_lon)[1],
-            }
+        asc_rasi_name = rasi_of[asc_rasi_idx]
+        asc_lord = _RASI_LORDS[asc_rasi_idx]
+        asc_nak_name, asc_nak_lord, _ = self._nakshatra(asc_lon)
+        asc_label = planet_of["Ascendant"]
+        rasi_bodies.append((asc_rasi_idx, asc_label))
+        navamsa_bodies.append((self._navamsa_rasi(asc_lon, asc_rasi_idx), asc_label))
+        asc_placement = Placement(
+            planet=asc_label,
+            lon=asc_lon,
+            position=self._format_deg(asc_lon),
+            degree=self._format_deg(asc_lon % 30),
+            rasi=asc_rasi_name,
+            rasi_en=asc_rasi_name_en,
+            rasi_lord=asc_lord,
+            nakshatra=asc_nak_name,
+            nakshatra_lord=asc_nak_lord,
         )
+        placements.append(asc_placement)
+        planet_positions.append(asc_placement.to_position())
 
         # Build rasi and navamsa charts (simple sign buckets)
-        def build_chart(entries: List[Dict[str, Any]], mapper):
+        def build_chart(bodies: List[Tuple[int, str]]):
             buckets: List[List[str]] = [[] for _ in range(12)]
-            for item in entries:
-                idx = mapper(item)
-                buckets[idx].append(item["planet"])
-            chart_rows: List[List[Dict[str, str]]] = []
-            for i in range(0, 12, 4):
-                row = []
-                for sign_idx in range(i, i + 4):
-                    row.append({"label": self.rasi_names[sign_idx], "bodies": ", ".join(buckets[sign_idx])})
-                chart_rows.append(row)
-            return chart_rows
-
-        rasi_chart = build_chart(
-            placements,
-            lambda p: int(p["lon"] // 30),
-        )
+            for idx, label in bodies:
+                buckets[idx].append(label)
+            # Three rows of four signs, in rasi order.
+            return [
+                [{"label": self.rasi_names[sign_idx], "bodies": ", ".join(buckets[sign_idx])} for sign_idx in range(i, i + 4)]
+                for i in range(0, 12, 4)
+            ]
 
-        navamsa_entries = []
-        for p in placements:
-            nav_idx = self._navamsa_rasi(p["lon"], int(p["lon"] // 30))
-            navamsa_entries.append({**p, "navamsa_index": nav_idx})
-        navamsa_chart = build_chart(navamsa_entries, lambda p: p["navamsa_index"])
+        rasi_chart = build_chart(rasi_bodies)
+        navamsa_chart = build_chart(navamsa_bodies)
 
         summary_label = place_name or f"Lat {lat}, Lon {lon}"
         if lang == "ta":
@@ -335,110 +453,81 @@ class HoroscopeService:
         else:
             summary = f"Horoscope generated for {date} {time} @ {summary_label} ({tz}) [{lang}]"
 
-        weekday_map = {
-            "en": ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"],
-            "ta": ["திங்கள்", "செவ்வாய்", "புதன்", "வியாழன்", "வெள்ளி", "சனி", "ஞாயிறு"],
-            "hi": ["सोमवार", "मंगलवार", "बुधवार", "गुरुवार", "शुक्रवार", "शनिवार", "रविवार"],
-        }
-        local_dt = dt_utc.astimezone(ZoneInfo(tz))
-        weekday_name = weekday_map.get(lang, weekday_map["en"])[local_dt.weekday()]
-
-        label_map = {
-            "Ascendant": {"en": "Ascendant", "ta": "லக்கணம்", "hi": "लग्न"},
-            "Ascendant Lord": {"en": "Ascendant Lord", "ta": "லக்கண அதிபதி", "hi": "लग्नेश"},
-            "Nakshatra": {"en": "Nakshatra", "ta": "நட்சத்திரம்", "hi": "नक्षत्र"},
-            "Nakshatra Lord": {"en": "Nakshatra Lord", "ta": "நட்சத்திர அதிபதி", "hi": "नक्षत्र स्वामी"},
-            "Weekday": {"en": "Weekday", "ta": "கிழமை", "hi": "वार"},
-            "Rasi": {"en": "Rasi", "ta": "ராசி", "hi": "राशि"},
-            "Rasi Lord": {"en": "Rasi Lord", "ta": "ராசி அதிபதி", "hi": "राशि स्वामी"},
-        }
+        local_dt = dt_utc.astimezone(local_tz)
+        weekday_name = _WEEKDAYS[lang][local_dt.weekday()]
 
         def lbl(key: str) -> str:
-            return label_map.get(key, {}).get(lang, key)
+            return _DETAIL_LABELS[lang].get(key, key)
 
         birth_details: List[Dict[str, str]] = []
 
         birth_details.append({"label": lbl("Ascendant"), "value": asc_rasi_name})
-        birth_details.append({"label": lbl("Ascendant Lord"), "value": self._planet_label(self.rasi_lords.get(asc_rasi_name_en, ""), lang)})
+        birth_details.append({"label": lbl("Ascendant Lord"), "value": planet_of[asc_lord]})
         birth_details.append({"label": lbl("Weekday"), "value": weekday_name})
 
-        moon_entry = next((p for p in placements if p.get("rawPlanet") == "Moon"), None)
+        moon_entry = next((p for p in placements if p.raw_planet == "Moon"), None)
         if moon_entry:
-            moon_nak = moon_entry.get("nakshatra")
-            moon_pada_val = moon_entry.get("pada")
+            moon_nak = moon_entry.nakshatra
+            moon_pada_val = moon_entry.pada
             moon_nak_label = f"{moon_nak} {moon_pada_val} Pada" if moon_nak and moon_pada_val else moon_nak
             if moon_nak_label:
                 birth_details.append({"label": lbl("Nakshatra"), "value": moon_nak_label})
-            if moon_entry.get("nakshatraLord"):
-                birth_details.append({"label": lbl("Nakshatra Lord"), "value": self._planet_label(moon_entry["nakshatraLord"], lang)})
+            if moon_entry.nakshatra_lord:
+                birth_details.append({"label": lbl("Nakshatra Lord"), "value": planet_of[moon_entry.nakshatra_lord]})
 
         birth_details.append({"label": lbl("Rasi"), "value": asc_rasi_name})
-        birth_details.append({"label": lbl("Rasi Lord"), "value": self._planet_label(self.rasi_lords.get(asc_rasi_name_en, ""), lang)})
+        birth_details.append({"label": lbl("Rasi Lord"), "value": planet_of[asc_lord]})
 
         def _build_mahadasa_plan() -> List[Dict[str, Any]]:
             """Simple Vimshottari schedule using Moon nakshatra lord (localized labels)."""
-            order = ["Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury"]
-            years = {"Ketu": 7, "Venus": 20, "Sun": 6, "Moon": 10, "Mars": 7, "Rahu": 18, "Jupiter": 16, "Saturn": 19, "Mercury": 17}
-            if moon_lord not in order or moon_lon is None:
+            if moon_lord not in _DASHA_YEARS or moon_lon is None:
                 return []
 
-            def label(name: str) -> str:
-                return self._planet_label(name, lang)
+            labels = {name: planet_of[name] for name in _DASHA_ORDER}
+
+            def day_iso(offset_days: float) -> str:
+                return (dt_utc + timedelta(days=offset_days)).date().isoformat()
 
             span_deg = 360 / 27
             frac_used = (moon_lon % span_deg) / span_deg
             frac_remaining = 1 - frac_used
-            start_idx = order.index(moon_lord)
-            cursor = dt_utc
+            start_idx = _DASHA_ORDER.index(moon_lord)
+            # Boundaries are tracked as day offsets from birth; each one becomes a datetime once, when formatted.
+            cursor = 0.0
             schedule: List[Dict[str, Any]] = []
-            for i in range(len(order)):
-                lord = order[(start_idx + i) % len(order)]
-                full_days = years[lord] * 365.25
-                days = full_days * (frac_remaining if i == 0 else 1)
-                end_dt = cursor + timedelta(days=days)
+            for i in range(len(_DASHA_ORDER)):
+                lord = _DASHA_ORDER[(start_idx + i) % len(_DASHA_ORDER)]
+                days = _DASHA_YEARS[lord] * 365.25 * (frac_remaining if i == 0 else 1)
                 bhuktis: List[Dict[str, Any]] = []
                 bhukti_cursor = cursor
-                for j in range(len(order)):
-                    sub_lord = order[j]
-                    sub_days = days * (years[sub_lord] / 120.0)
-                    sub_end = bhukti_cursor + timedelta(days=sub_days)
+                bhukti_start = day_iso(cursor)
+                for sub_lord, share in zip(_DASHA_ORDER, _BHUKTI_SHARES):
+                    bhukti_cursor += days * share
+                    bhukti_end = day_iso(bhukti_cursor)
                     bhuktis.append(
                         {
-                            "name": f"{label(lord)} / {label(sub_lord)}",
-                            "start": bhukti_cursor.date().isoformat(),
-                            "end": sub_end.date().isoformat(),
+                            "name": f"{labels[lord]} / {labels[sub_lord]}",
+                            "start": bhukti_start,
+                            "end": bhukti_end,
                         }
                     )
-                    bhukti_cursor = sub_end
+                    bhukti_start = bhukti_end
+                cursor += days
                 schedule.append(
                     {
-                        "name": label(lord),
+                        "name": labels[lord],
                         "start": bhuktis[0]["start"],
-                        "end": end_dt.date().isoformat(),
+                        "end": day_iso(cursor),
                         "bhuktis": bhuktis,
                     }
                 )
-                cursor = end_dt
-                frac_remaining = 1  # only first mahadasa is partial
             return schedule
 
         return {
-            "correlationId": str(uuid.uuid4()),
             "summary": summary,
             "rasiChart": rasi_chart,
             "navamsaChart": navamsa_chart,
-            "planetPositions": [
-                {
-                    "planet": p["planet"],
-                    "position": p["position"],
-                    "degree": p["degree"],
-                    "rasi": p["rasi"],
-                    "rasiLord": p["rasiLord"],
-                    "nakshatra": p["nakshatra"],
-                    "nakshatraLord": p["nakshatraLord"],
-                }
-                for p in placements
-            ],
+            "planetPositions": planet_positions,
             "birthDetails": birth_details,
             "meta": {
                 "methodology": "tamil",
@@ -1,15 +1,18 @@
 import asyncio
-import random
+import hashlib
+import heapq
+import hmac
+import secrets
 import time
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from ..config import settings
 
 
 @dataclass
 class OTPRecord:
-    otp_hash: str
+    otp_hash: bytes
     expires_at: float
     attempts: int = 0
 
@@ -19,15 +22,23 @@ class OTPService:
 
     def __init__(self):
         self._store: Dict[str, OTPRecord] = {}
+        # (expires_at, identifier) min-heap so cleanup only touches entries that have actually expired.
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # Without a configured secret, a per-process key still works: OTPs only live in this process's memory.
+        self._key = settings.otp_secret.encode() if settings.otp_secret else secrets.token_bytes(32)
 
-    def _hash(self, value: str) -> str:
-        # Keep simple here; replace with a secure hash and secret
-        return value[::-1]
+    def _hash(self, value: str) -> bytes:
+        return hmac.new(self._key, value.encode(), hashlib.sha256).digest()
 
     async def generate(self, identifier: str) -> str:
-        otp = f"{random.randint(0, 999999):06d}"
-        expires_at = time.time() + settings.otp_ttl_seconds
+        otp = f"{secrets.randbelow(1_000_000):06d}"
+        now = time.time()
+        # Amortized cleanup: every issue first drops whatever has expired, so the store and heap stay bounded
+        # by the OTPs issued within one TTL even if cleanup() is never scheduled.
+        self._purge_expired(now)
+        expires_at = now + settings.otp_ttl_seconds
         self._store[identifier] = OTPRecord(otp_hash=self._hash(otp), expires_at=expires_at)
+        heapq.heappush(self._expiry_heap, (expires_at, identifier))
         # TODO: integrate with email/SMS providers via Graph or third-party
         return otp
 
@@ -36,11 +47,12 @@ class OTPService:
         if not record:
             return False
         if time.time() > record.expires_at:
+            del self._store[identifier]
             return False
         if record.attempts >= 5:
             return False
         record.attempts += 1
-        if record.otp_hash != self._hash(otp):
+        if not hmac.compare_digest(record.otp_hash, self._hash(otp)):
             return False
         # On success, delete to prevent reuse
         del self._store[identifier]
@@ -48,8 +60,14 @@ class OTPService:
 
     async def cleanup(self) -> None:
         # For production use, schedule this or move to a durable store
-        now = time.time()
-        expired = [k for k, v in self._store.items() if v.expires_at < now]
-        for key in expired:
-            del self._store[key]
+        self._purge_expired(time.time())
         await asyncio.sleep(0)
+
+    def _purge_expired(self, now: float) -> None:
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            record = self._store.get(key)
+            # A re-issued OTP has a later expiry and its own heap entry; leave it alone.
+            if record is not None and record.expires_at <= expires_at:
+                del self._store[key]
@@ -1,21 +1,164 @@
 import math
 import asyncio
 import json
+from collections import OrderedDict
 from datetime import datetime, date, timedelta, time
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+import httpx
+
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI
 except Exception:  # pragma: no cover
-    OpenAI = None
+    AsyncOpenAI = None
 
 from ..config import settings
-from ..schemas import PanchangData
+from ..schemas import PanchangAstronomy, PanchangData, PanchangMeta
 from .sharepoint_client import SharePointClientStub
 from .timezone_alias_helper import TimezoneAliasHelper
 
 
+# Informal timezone names (lower-cased) mapped to IANA ids.
+_GUESS_ALIASES = {
+    "asia/chennai": "Asia/Kolkata",
+    "asia/calcutta": "Asia/Kolkata",
+    "ist": "Asia/Kolkata",
+    "pst": "America/Los_Angeles",
+    "pdt": "America/Los_Angeles",
+    "est": "America/New_York",
+    "edt": "America/New_York",
+    "cst": "America/Chicago",
+    "cdt": "America/Chicago",
+    "mst": "America/Denver",
+    "mdt": "America/Denver",
+    "bst": "Europe/London",
+    "cet": "Europe/Berlin",
+    "cest": "Europe/Berlin",
+    "aest": "Australia/Sydney",
+    "aedt": "Australia/Sydney",
+    "nzst": "Pacific/Auckland",
+    "hkt": "Asia/Hong_Kong",
+    "sgt": "Asia/Singapore",
+    "wib": "Asia/Jakarta",
+}
+
+# Upper bound on remembered alias resolutions; tz strings come straight from callers.
+_RESOLVED_TZ_CAP = 512
+
+# Panchanga anga names, cycled deterministically by date.
+_TITHIS = (
+    "Pratipada",
+    "Dwitiya",
+    "Tritiya",
+    "Chaturthi",
+    "Panchami",
+    "Shashthi",
+    "Saptami",
+    "Ashtami",
+    "Navami",
+    "Dashami",
+    "Ekadashi",
+    "Dwadashi",
+    "Trayodashi",
+    "Chaturdashi",
+    "Purnima/Amavasya",
+)
+_NAKSHATRAS = (
+    "Ashwini",
+    "Bharani",
+    "Krittika",
+    "Rohini",
+    "Mrigashirsha",
+    "Ardra",
+    "Punarvasu",
+    "Pushya",
+    "Ashlesha",
+    "Magha",
+    "Purva Phalguni",
+    "Uttara Phalguni",
+    "Hasta",
+    "Chitra",
+    "Swati",
+    "Vishakha",
+    "Anuradha",
+    "Jyeshtha",
+    "Mula",
+    "Purvashada",
+    "Uttarashada",
+    "Shravana",
+    "Dhanishta",
+    "Shatabhisha",
+    "Purva Bhadrapada",
+    "Uttara Bhadrapada",
+    "Revati",
+)
+_YOGAS = ("Vishkambha", "Priti", "Ayushman", "Saubhagya", "Shobhana", "Atiganda", "Sukarman", "Dhriti")
+_KARANAS = ("Bava", "Balava", "Kaulava", "Taitila", "Garaja", "Vanija", "Vishti", "Shakuni", "Chatushpada", "Naga")
+
+# 1-based day segment (of 8) for each weekday, Monday=0.
+_RAHU_SEGMENT = (2, 7, 5, 6, 4, 3, 8)
+_YAMAGANDAM_SEGMENT = (4, 3, 2, 1, 7, 6, 5)
+_GULIKAI_SEGMENT = (6, 5, 4, 3, 2, 1, 7)
+
+# Dur Muhurtam windows per weekday (Monday=0) as (offset, duration, phase, night) in ghatis,
+# counted from sunrise, or from sunset for night windows.
+_DURMUHURTAM = (
+    ((16, 2, "day", False), (22, 2, "day", False)),
+    ((6, 2, "day", False), (14, 2, "night", True)),
+    ((14, 2, "day", False),),
+    ((10, 2, "day", False), (22, 2, "day", False)),
+    ((6, 2, "day", False), (22, 2, "day", False)),
+    ((0, 4, "day", False),),
+    ((0, 4, "day", False),),
+)
+
+
+_PLACE_CACHE_CAP = 1024
+_AI_TZ_CACHE_CAP = 2048
+# Nominatim's usage policy allows at most one request per second per application.
+_NOMINATIM_INTERVAL = 1.0
+
+# Seasonal day-length factor by day of year (index 1-366), a cosine peaking at the June solstice.
+_SEASONAL = tuple(math.cos(2 * math.pi * (d - 172) / 365.0) for d in range(367))
+
+
+@lru_cache(maxsize=512)
+def _zoneinfo_cached(key: str) -> Optional[ZoneInfo]:
+    try:
+        return ZoneInfo(key)
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+class Window(NamedTuple):
+    start: datetime
+    end: datetime
+    phase: Optional[str] = None
+    nakshatra: Optional[str] = None
+
+
+def _fmt_basic(w: Window, label: str, kind: str) -> List[dict]:
+    return [{"start": w.start.isoformat(), "end": w.end.isoformat(), "label": label, "kind": kind}]
+
+
+def _fmt_phase(windows: List[Window], label: str, kind: str) -> List[dict]:
+    return [
+        {"start": w.start.isoformat(), "end": w.end.isoformat(), "label": label, "kind": kind, "phase": w.phase}
+        for w in windows
+    ]
+
+
+def _fmt_nakshatra(w: Window, label: str, kind: str) -> List[dict]:
+    return [{"start": w.start.isoformat(), "end": w.end.isoformat(), "label": label, "kind": kind, "nakshatra": w.nakshatra}]
+
+
+def _yday(d: date) -> int:
+    # Day of year without building a struct_time.
+    return d.toordinal() - date(d.year, 1, 1).toordinal() + 1
+
+
 def _clamp(val: float, low: float, high: float) -> float:
     return max(low, min(high, val))
 
@@ -29,90 +172,108 @@ class PanchangService:
     but stable and monotonic so the UI has consistent data to render.
     """
 
-    def __init__(self, sharepoint: SharePointClientStub):
+    def __init__(
+        self,
+        sharepoint: SharePointClientStub,
+        http_client: httpx.AsyncClient,
+        openai_client: Optional["AsyncOpenAI"] = None,
+    ):
         self.sharepoint = sharepoint
+        # Shared geocoding pool from deps; its lifecycle (and aclose on shutdown) is owned there.
+        self._http_client = http_client
+        self._nominatim_lock = asyncio.Lock()
+        self._last_nominatim_ts = 0.0
         self.tz_helper = TimezoneAliasHelper(sharepoint)
-        self._guess_aliases = {
-            "asia/chennai": "Asia/Kolkata",
-            "asia/calcutta": "Asia/Kolkata",
-            "ist": "Asia/Kolkata",
-            "pst": "America/Los_Angeles",
-            "pdt": "America/Los_Angeles",
-            "est": "America/New_York",
-            "edt": "America/New_York",
-            "cst": "America/Chicago",
-            "cdt": "America/Chicago",
-            "mst": "America/Denver",
-            "mdt": "America/Denver",
-            "bst": "Europe/London",
-            "cet": "Europe/Berlin",
-            "cest": "Europe/Berlin",
-            "aest": "Australia/Sydney",
-            "aedt": "Australia/Sydney",
-            "nzst": "Pacific/Auckland",
-            "hkt": "Asia/Hong_Kong",
-            "sgt": "Asia/Singapore",
-            "wib": "Asia/Jakarta",
-        }
-        self._openai_client: Optional[OpenAI] = None
+        self._guess_aliases = _GUESS_ALIASES
+        # Resolved zones by raw tz string, so repeat keys skip the SharePoint alias lookup.
+        self._resolved_tz: Dict[str, ZoneInfo] = {}
+        self._openai_client = openai_client
         self._fallback_tz = "UTC"
+        # Resolved places by rounded coords / place name, so repeat lookups skip SharePoint and Nominatim.
+        self._place_cache: "OrderedDict[Tuple[str, str], dict]" = OrderedDict()
+        self._name_cache: "OrderedDict[str, dict]" = OrderedDict()
+        # Answers from the OpenAI timezone prompts, including UNKNOWN (None); API failures are not cached.
+        # Keys are ("coord", lat, lon) or ("tz", name) so the two prompts can never answer for each other.
+        self._ai_tz_cache: "OrderedDict[Tuple, Optional[str]]" = OrderedDict()
+
+    @staticmethod
+    def _lru_get(cache: OrderedDict, key) -> Optional[dict]:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    @staticmethod
+    def _lru_put(cache: OrderedDict, key, value: dict) -> dict:
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > _PLACE_CACHE_CAP:
+            cache.popitem(last=False)
+        return value
+
+    def _remember_ai_tz(self, key: Tuple, guess: Optional[str]) -> Optional[str]:
+        self._ai_tz_cache[key] = guess
+        if len(self._ai_tz_cache) > _AI_TZ_CACHE_CAP:
+            self._ai_tz_cache.popitem(last=False)
+        return guess
 
     def _compute_day_lengths(self, target_date: date, lat: float) -> float:
         # Simple seasonality approximation using declination cosine curve.
-        day_num = target_date.timetuple().tm_yday
-        lat_rad = math.radians(lat)
-        seasonal = math.cos(2 * math.pi * (day_num - 172) / 365.0)
-        day_length = 12 + 2.5 * math.cos(lat_rad) * seasonal
-        return _clamp(day_length, 8.0, 16.0)
+        seasonal = _SEASONAL[_yday(target_date)]
+        return _clamp(12 + 2.5 * math.cos(math.radians(lat)) * seasonal, 8.0, 16.0)
 
     async def _resolve_timezone(self, tz: str) -> ZoneInfo:
         tz_key = tz.strip()
+        zone = self._resolved_tz.get(tz_key) or _zoneinfo_cached(tz_key)
+        if zone is None:
+            zone = await self._resolve_timezone_alias(tz_key)
+            if zone is None:
+                raise ValueError(f"No time zone found with key {tz}")
+            if len(self._resolved_tz) < _RESOLVED_TZ_CAP:
+                self._resolved_tz[tz_key] = zone
+        return zone
+
+    async def _resolve_timezone_alias(self, tz_key: str) -> Optional[ZoneInfo]:
+        """Resolve a non-IANA key via the SharePoint alias list, the built-in guesses, then the AI guess."""
         alias = await self.sharepoint.get_timezone_alias(tz_key)
         if alias:
-            try:
-                return ZoneInfo(alias)
-            except ZoneInfoNotFoundError:
-                pass
-        try:
-            return ZoneInfo(tz_key)
-        except ZoneInfoNotFoundError:
-            guess = self._guess_aliases.get(tz_key.lower())
-            if guess:
-                try:
-                    zone = ZoneInfo(guess)
-                    await self.sharepoint.upsert_timezone_alias(tz_key, guess)
-                    return zone
-                except ZoneInfoNotFoundError:
-                    pass
-            ai_guess = await self._guess_timezone_with_ai(tz_key)
-            if ai_guess:
-                try:
-                    zone = ZoneInfo(ai_guess)
-                    await self.sharepoint.upsert_timezone_alias(tz_key, ai_guess)
-                    return zone
-                except ZoneInfoNotFoundError:
-                    pass
-            raise ValueError(f"No time zone found with key {tz}")
+            zone = _zoneinfo_cached(alias)
+            if zone is not None:
+                return zone
+        guess = self._guess_aliases.get(tz_key.lower())
+        if guess:
+            zone = _zoneinfo_cached(guess)
+            if zone is not None:
+                await self.sharepoint.upsert_timezone_alias(tz_key, guess)
+                return zone
+        ai_guess = await self._guess_timezone_with_ai(tz_key)
+        if ai_guess:
+            zone = _zoneinfo_cached(ai_guess)
+            if zone is not None:
+                await self.sharepoint.upsert_timezone_alias(tz_key, ai_guess)
+                return zone
+        return None
 
     async def _timezone_from_coords(self, lat: float, lon: float) -> Optional[str]:
-        if OpenAI is None or not settings.openai_api_key:
-            return None
         if self._openai_client is None:
-            self._openai_client = OpenAI(api_key=settings.openai_api_key, base_url=settings.openai_base_url)
+            return None
+        # ~1 km resolution; finer precision never moves a point across a zone boundary in practice.
+        cache_key = ("coord", round(lat, 2), round(lon, 2))
+        if cache_key in self._ai_tz_cache:
+            self._ai_tz_cache.move_to_end(cache_key)
+            return self._ai_tz_cache[cache_key]
         prompt = (
             "You map latitude/longitude to an IANA timezone id. "
             "Given numeric lat and lon, respond ONLY with the timezone string. If unsure, respond UNKNOWN."
         )
         try:
-            response = await asyncio.to_thread(
-                lambda: self._openai_client.responses.create(
-                    model=settings.openai_model,
-                    input=[
-                        {"role": "system", "content": prompt},
-                        {"role": "user", "content": f"lat={lat}, lon={lon}"},
-                    ],
-                    max_output_tokens=16,
-                )
+            response = await self._openai_client.responses.create(
+                model=settings.openai_model,
+                input=[
+                    {"role": "system", "content": prompt},
+                    {"role": "user", "content": f"lat={lat}, lon={lon}"},
+                ],
+                max_output_tokens=16,
             )
         except Exception:
             return None
@@ -123,8 +284,8 @@ class PanchangService:
                     text += "".join([seg.text for seg in item.content if hasattr(seg, "text")])
         guess = text.strip()
         if not guess or "UNKNOWN" in guess.upper():
-            return None
-        return guess.split()[0]
+            return self._remember_ai_tz(cache_key, None)
+        return self._remember_ai_tz(cache_key, guess.split()[0])
 
     def _base_times(self, target_date: date, tz: ZoneInfo, day_length_hours: float) -> Dict[str, datetime]:
         # Center day around 12:00 local; derive sunrise/sunset.
@@ -135,70 +296,42 @@ class PanchangService:
         next_sunrise = sunrise + timedelta(days=1)
         return {"sunrise": sunrise, "sunset": sunset, "nextSunrise": next_sunrise}
 
-    def _segment_window(self, sunrise: datetime, sunset: datetime, segment_index: int) -> Dict[str, datetime]:
+    def _segment_window(self, sunrise: datetime, sunset: datetime, segment_index: int) -> Window:
         # Segment indices are 1-based per spec.
         day_length = sunset - sunrise
         seg = day_length / 8
         start = sunrise + seg * (segment_index - 1)
-        end = start + seg
-        return {"start": start, "end": end}
+        return Window(start, start + seg)
 
     def _map_rahu_windows(self, weekday: int, sunrise: datetime, sunset: datetime):
         # weekday: Monday=0
-        mapping = {0: 2, 1: 7, 2: 5, 3: 6, 4: 4, 5: 3, 6: 8}
-        seg = mapping.get(weekday, 2)
-        return [self._segment_window(sunrise, sunset, seg)]
+        return self._segment_window(sunrise, sunset, _RAHU_SEGMENT[weekday])
 
     def _map_yamagandam(self, weekday: int, sunrise: datetime, sunset: datetime):
-        mapping = {0: 4, 1: 3, 2: 2, 3: 1, 4: 7, 5: 6, 6: 5}
-        seg = mapping.get(weekday, 4)
-        return [self._segment_window(sunrise, sunset, seg)]
+        return self._segment_window(sunrise, sunset, _YAMAGANDAM_SEGMENT[weekday])
 
     def _map_gulikai(self, weekday: int, sunrise: datetime, sunset: datetime):
-        mapping = {0: 6, 1: 5, 2: 4, 3: 3, 4: 2, 5: 1, 6: 7}
-        seg = mapping.get(weekday, 6)
-        return [self._segment_window(sunrise, sunset, seg)]
+        return self._segment_window(sunrise, sunset, _GULIKAI_SEGMENT[weekday])
 
     def _brahma_muhurta(self, sunrise: datetime):
         start = sunrise - timedelta(minutes=96)
         end = sunrise - timedelta(minutes=48)
-        return [{"start": start, "end": end}]
+        return Window(start, end)
 
     def _abhijit_muhurta(self, sunrise: datetime, sunset: datetime):
         length = sunset - sunrise
         half_window = length / 30
         mid = sunrise + length / 2
-        return [{"start": mid - half_window, "end": mid + half_window}]
+        return Window(mid - half_window, mid + half_window)
 
     def _durmuhurtam(self, weekday: int, sunrise: datetime, sunset: datetime, next_sunrise: datetime):
         day_ghati = (sunset - sunrise) / 30
         night_ghati = (next_sunrise - sunset) / 30
-        windows: List[Dict[str, datetime]] = []
-
-        def add(offset, duration, phase="day", night=False):
-            base = sunset if night else sunrise
-            start = base + (night_ghati if night else day_ghati) * offset
-            end = start + (night_ghati if night else day_ghati) * duration
-            windows.append({"start": start, "end": end, "phase": phase})
-
-        if weekday == 6:  # Sunday index=6? actually Monday=0; Sunday=6
-            add(0, 4, phase="day")
-        elif weekday == 0:  # Monday
-            add(16, 2)
-            add(22, 2)
-        elif weekday == 1:  # Tuesday
-            add(6, 2)
-            add(14, 2, phase="night", night=True)
-        elif weekday == 2:  # Wednesday
-            add(14, 2)
-        elif weekday == 3:  # Thursday
-            add(10, 2)
-            add(22, 2)
-        elif weekday == 4:  # Friday
-            add(6, 2)
-            add(22, 2)
-        elif weekday == 5:  # Saturday
-            add(0, 4)
+        windows: List[Window] = []
+        for offset, duration, phase, night in _DURMUHURTAM[weekday]:
+            base, ghati = (sunset, night_ghati) if night else (sunrise, day_ghati)
+            start = base + ghati * offset
+            windows.append(Window(start, start + ghati * duration, phase=phase))
         return windows
 
     def _varjyam(self, day_index: int, sunrise: datetime, sunset: datetime):
@@ -206,36 +339,15 @@ class PanchangService:
         offset_minutes = 60 + (day_index % 120)
         duration = 50
         start = sunrise + timedelta(minutes=offset_minutes)
-        end = start + timedelta(minutes=duration)
-        return [{"start": start, "end": end, "nakshatra": "Varjyam"}]
-
-    def _format_dt(self, dt: datetime) -> str:
-        return dt.isoformat()
-
-    def _format_windows(self, windows: List[Dict[str, datetime]], label: str | None = None, kind: str | None = None):
-        formatted = []
-        for w in windows:
-            entry = {
-                "start": self._format_dt(w["start"]),
-                "end": self._format_dt(w["end"]),
-            }
-            if label:
-                entry["label"] = label
-            if kind:
-                entry["kind"] = kind
-            if "phase" in w:
-                entry["phase"] = w["phase"]
-            if "nakshatra" in w:
-                entry["nakshatra"] = w["nakshatra"]
-            formatted.append(entry)
-        return formatted
+        return Window(start, start + timedelta(minutes=duration), nakshatra="Varjyam")
 
     async def _guess_timezone_with_ai(self, tz_key: str) -> Optional[str]:
-        if OpenAI is None or not settings.openai_api_key:
-            return None
-
         if self._openai_client is None:
-            self._openai_client = OpenAI(api_key=settings.openai_api_key, base_url=settings.openai_base_url)
+            return None
+        cache_key = ("tz", tz_key.lower())
+        if cache_key in self._ai_tz_cache:
+            self._ai_tz_cache.move_to_end(cache_key)
+            return self._ai_tz_cache[cache_key]
 
         prompt = (
             "You are a helper that maps informal or abbreviated timezone names to canonical IANA timezone identifiers. "
@@ -243,15 +355,13 @@ class PanchangService:
             "If you cannot map, respond with 'UNKNOWN'."
         )
         try:
-            response = await asyncio.to_thread(
-                lambda: self._openai_client.responses.create(
-                    model=settings.openai_model,
-                    input=[
-                        {"role": "system", "content": prompt},
-                        {"role": "user", "content": f"Input: {tz_key}"},
-                    ],
-                    max_output_tokens=16,
-                )
+            response = await self._openai_client.responses.create(
+                model=settings.openai_model,
+                input=[
+                    {"role": "system", "content": prompt},
+                    {"role": "user", "content": f"Input: {tz_key}"},
+                ],
+                max_output_tokens=16,
             )
         except Exception:
             return None
@@ -263,22 +373,26 @@ class PanchangService:
                     text += "".join([seg.text for seg in item.content if hasattr(seg, "text")])
         guess = text.strip()
         if not guess or "UNKNOWN" in guess.upper():
-            return None
-        return guess.split()[0]
+            return self._remember_ai_tz(cache_key, None)
+        return self._remember_ai_tz(cache_key, guess.split()[0])
 
     async def resolve_place_with_ai(self, place: str) -> Optional[dict]:
         if not place:
             return None
-        cached = await self.tz_helper.get(place.strip())
+        key = place.strip()
+        hit = self._lru_get(self._name_cache, key)
+        if hit is not None:
+            return dict(hit)
+        cached = await self.tz_helper.get(key)
         if cached and cached.get("timezone"):
             try:
                 tz = cached.get("timezone") or self._fallback_tz
-                return {
+                return dict(self._lru_put(self._name_cache, key, {
                     "lat": float(cached.get("lat") or 0.0) if cached.get("lat") else None,
                     "lon": float(cached.get("long") or 0.0) if cached.get("long") else None,
                     "tz": tz,
                     "name": cached.get("title") or place,
-                }
+                }))
             except Exception:
                 pass
 
@@ -288,21 +402,25 @@ class PanchangService:
         if not result.get("tz"):
             result["tz"] = self._fallback_tz
         await self.tz_helper.upsert(result["name"], result["tz"], str(result["lat"]), str(result["lon"]))
-        return result
+        return dict(self._lru_put(self._name_cache, key, result))
 
     async def resolve_place_from_coords(self, lat: float, lon: float) -> Optional[dict]:
         lat_str = f"{lat:.4f}"
         lon_str = f"{lon:.4f}"
+        key = (lat_str, lon_str)
+        hit = self._lru_get(self._place_cache, key)
+        if hit is not None:
+            return dict(hit)
         cached = await self.tz_helper.get_by_coords(lat_str, lon_str)
         if cached and cached.get("timezone"):
             try:
                 tz = cached.get("timezone") or self._fallback_tz
-                return {
+                return dict(self._lru_put(self._place_cache, key, {
                     "lat": float(cached.get("lat") or lat),
                     "lon": float(cached.get("long") or lon),
                     "tz": tz,
                     "name": cached.get("title") or "",
-                }
+                }))
             except Exception:
                 pass
 
@@ -312,7 +430,19 @@ class PanchangService:
         if not result.get("tz"):
             result["tz"] = self._fallback_tz
         await self.tz_helper.upsert(result["name"], result["tz"], lat_str, lon_str)
-        return result
+        return dict(self._lru_put(self._place_cache, key, result))
+
+    async def _nominatim_get(self, url: str) -> httpx.Response:
+        # Queue concurrent lookups and space them out instead of drawing 429s from the public endpoint.
+        async with self._nominatim_lock:
+            loop = asyncio.get_running_loop()
+            wait = _NOMINATIM_INTERVAL - (loop.time() - self._last_nominatim_ts)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                return await self._http_client.get(url)
+            finally:
+                self._last_nominatim_ts = loop.time()
 
     async def _reverse_geocode_nominatim(
         self, place: str | None = None, lat: float | None = None, lon: float | None = None
@@ -330,12 +460,9 @@ class PanchangService:
                     "https://nominatim.openstreetmap.org/reverse?"
                     f"format=jsonv2&lat={lat}&lon={lon}&zoom=10"
                 )
-            import httpx
-
-            async with httpx.AsyncClient(headers={"User-Agent": "astrozone/1.0 (panchang)"}, timeout=8.0) as client:
-                resp = await client.get(url)
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await self._nominatim_get(url)
+            resp.raise_for_status()
+            data = resp.json()
             if place:
                 results = data if isinstance(data, list) else data.get("results") or []
                 if not results:
@@ -374,95 +501,53 @@ class PanchangService:
         sunrise = base_times["sunrise"]
         sunset = base_times["sunset"]
         next_sunrise = base_times["nextSunrise"]
+        # Each of these is rendered several times below; format them once.
+        sunrise_iso = sunrise.isoformat()
+        sunset_iso = sunset.isoformat()
+        next_sunrise_iso = next_sunrise.isoformat()
 
         weekday = target_date.weekday()  # Monday=0
         day_length_minutes = int((sunset - sunrise).total_seconds() // 60)
         night_length_minutes = int((next_sunrise - sunset).total_seconds() // 60)
 
         # Core windows
-        rahu = self._format_windows(self._map_rahu_windows(weekday, sunrise, sunset), label="Rahu Kalam", kind="avoid")
-        yama = self._format_windows(self._map_yamagandam(weekday, sunrise, sunset), label="Yamagandam", kind="avoid")
-        gulikai = self._format_windows(self._map_gulikai(weekday, sunrise, sunset), label="Gulikai", kind="avoid")
-        brahma = self._format_windows(self._brahma_muhurta(sunrise), label="Brahma Muhurta", kind="auspicious")
-        abhijit = self._format_windows(self._abhijit_muhurta(sunrise, sunset), label="Abhijit Muhurta", kind="auspicious")
-        durmuhurtam = self._format_windows(self._durmuhurtam(weekday, sunrise, sunset, next_sunrise), label="Dur Muhurtam", kind="avoid")
-        varjyam = self._format_windows(self._varjyam(target_date.timetuple().tm_yday, sunrise, sunset), label="Varjyam", kind="avoid")
+        # Each builder yields a fixed window shape, so pair it with the matching formatter.
+        rahu = _fmt_basic(self._map_rahu_windows(weekday, sunrise, sunset), label="Rahu Kalam", kind="avoid")
+        yama = _fmt_basic(self._map_yamagandam(weekday, sunrise, sunset), label="Yamagandam", kind="avoid")
+        gulikai = _fmt_basic(self._map_gulikai(weekday, sunrise, sunset), label="Gulikai", kind="avoid")
+        brahma = _fmt_basic(self._brahma_muhurta(sunrise), label="Brahma Muhurta", kind="auspicious")
+        abhijit = _fmt_basic(self._abhijit_muhurta(sunrise, sunset), label="Abhijit Muhurta", kind="auspicious")
+        durmuhurtam = _fmt_phase(self._durmuhurtam(weekday, sunrise, sunset, next_sunrise), label="Dur Muhurtam", kind="avoid")
+        varjyam = _fmt_nakshatra(self._varjyam(_yday(target_date), sunrise, sunset), label="Varjyam", kind="avoid")
 
         # Panchanga angas (deterministic cycling)
-        tithis = [
-            "Pratipada",
-            "Dwitiya",
-            "Tritiya",
-            "Chaturthi",
-            "Panchami",
-            "Shashthi",
-            "Saptami",
-            "Ashtami",
-            "Navami",
-            "Dashami",
-            "Ekadashi",
-            "Dwadashi",
-            "Trayodashi",
-            "Chaturdashi",
-            "Purnima/Amavasya",
-        ]
-        nakshatras = [
-            "Ashwini",
-            "Bharani",
-            "Krittika",
-            "Rohini",
-            "Mrigashirsha",
-            "Ardra",
-            "Punarvasu",
-            "Pushya",
-            "Ashlesha",
-            "Magha",
-            "Purva Phalguni",
-            "Uttara Phalguni",
-            "Hasta",
-            "Chitra",
-            "Swati",
-            "Vishakha",
-            "Anuradha",
-            "Jyeshtha",
-            "Mula",
-            "Purvashada",
-            "Uttarashada",
-            "Shravana",
-            "Dhanishta",
-            "Shatabhisha",
-            "Purva Bhadrapada",
-            "Uttara Bhadrapada",
-            "Revati",
-        ]
-        yogas = ["Vishkambha", "Priti", "Ayushman", "Saubhagya", "Shobhana", "Atiganda", "Sukarman", "Dhriti"]
-        karanas = ["Bava", "Balava", "Kaulava", "Taitila", "Garaja", "Vanija", "Vishti", "Shakuni", "Chatushpada", "Naga"]
 
         def pick(seq, offset=0):
             return seq[(target_date.toordinal() + offset) % len(seq)]
 
-        anga_block = lambda name: [{"name": name, "start": sunrise.isoformat(), "end": sunset.isoformat()}]
-
-        data = PanchangData(
-            meta={
-                "date": target_date.isoformat(),
-                "timezone": tz,
-                "location": {"lat": lat, "lon": lon, "name": location_name},
-                "hinduDay": {"start": sunrise.isoformat(), "end": next_sunrise.isoformat()},
-            },
-            astronomy={
-                "sunrise": sunrise.isoformat(),
-                "sunset": sunset.isoformat(),
-                "nextSunrise": next_sunrise.isoformat(),
-                "dayLengthMinutes": day_length_minutes,
-                "nightLengthMinutes": night_length_minutes,
-            },
+        anga_block = lambda name: [{"name": name, "start": sunrise_iso, "end": sunset_iso}]
+
+        # Every value is built here from trusted primitives, so skip pydantic validation.
+        data = PanchangData.model_construct(
+            meta=PanchangMeta.model_construct(
+                date=target_date.isoformat(),
+                timezone=tz,
+                location={"lat": lat, "lon": lon, "name": location_name},
+                hinduDay={"start": sunrise_iso, "end": next_sunrise_iso},
+            ),
+            astronomy=PanchangAstronomy.model_construct(
+                sunrise=sunrise_iso,
+                sunset=sunset_iso,
+                nextSunrise=next_sunrise_iso,
+                dayLengthMinutes=day_length_minutes,
+                nightLengthMinutes=night_length_minutes,
+            ),
             panchang={
                 "vara": {"name": target_date.strftime("%A")},
-                "tithi": anga_block(pick(tithis)),
-                "nakshatra": anga_block(pick(nakshatras, offset=3)),
-                "yoga": anga_block(pick(yogas, offset=5)),
-                "karana": anga_block(pick(karanas, offset=7)),
+                "tithi": anga_block(pick(_TITHIS)),
+                "nakshatra": anga_block(pick(_NAKSHATRAS, offset=3)),
+                "yoga": anga_block(pick(_YOGAS, offset=5)),
+                "karana": anga_block(pick(_KARANAS, offset=7)),
             },
             timings={
                 "rahuKalam": rahu,
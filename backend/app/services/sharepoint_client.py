@@ -1,29 +1,167 @@
-import asyncio
 import hashlib
-import json
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
 
 import httpx
+import orjson
 
 from ..config import settings
+from .single_flight import SingleFlight
 
 
-def _hash_profile(profile: dict) -> str:
-  serialized = json.dumps(profile, sort_keys=True)
-  return hashlib.sha256(serialized.encode()).hexdigest()
+def _odata_escape(value: str) -> str:
+  # OData string literals escape an embedded apostrophe by doubling it.
+  return str(value).replace("'", "''")
+
+
+def _batch_key(methodology: str, title: str, start_date: str, end_date: str, zodiac_signs: str) -> str:
+  """Stable identity for a guidance batch row, stored in the indexed Title column."""
+  raw = "|".join((methodology, title, start_date, end_date, zodiac_signs)).encode()
+  return hashlib.blake2b(raw, digest_size=16).hexdigest()
 
 
-@dataclass
+def _hash_profile(profile: dict) -> str:
+  return hashlib.blake2b(orjson.dumps(profile, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+
+
+def _freeze(value: Any) -> Any:
+  """Read-only view of a Graph lookup result: dicts become mapping proxies, lists tuples of them."""
+  if isinstance(value, dict):
+    return MappingProxyType(value)
+  if isinstance(value, list):
+    return tuple(_freeze(item) for item in value)
+  return value
+
+
+# Upper bound on in-memory guidance entries; the least recently used entry is dropped beyond it.
+_GUIDANCE_CACHE_CAP = 10_000
+_GUIDANCE_SWEEP_PER_PUT = 4
+# How long Graph-backed sign lists and prompt templates are reused before re-reading the list.
+_GRAPH_LOOKUP_TTL_SECONDS = 300
+# Refresh the Graph token this long before it expires so in-flight calls never carry a stale one.
+_TOKEN_REFRESH_MARGIN_SECONDS = 60
+
+
+# Stub sign rows shared by every methodology; read-only so one caller cannot corrupt the others.
+_BASE_SIGNS = tuple(
+  MappingProxyType(sign)
+  for sign in (
+    {"code": "ARIES", "displayName": "Aries", "english": "Aries", "sequence": 1},
+    {"code": "TAURUS", "displayName": "Taurus", "english": "Taurus", "sequence": 2},
+    {"code": "GEMINI", "displayName": "Gemini", "english": "Gemini", "sequence": 3},
+    {"code": "CANCER", "displayName": "Cancer", "english": "Cancer", "sequence": 4},
+    {"code": "LEO", "displayName": "Leo", "english": "Leo", "sequence": 5},
+    {"code": "VIRGO", "displayName": "Virgo", "english": "Virgo", "sequence": 6},
+    {"code": "LIBRA", "displayName": "Libra", "english": "Libra", "sequence": 7},
+    {"code": "SCORPIO", "displayName": "Scorpio", "english": "Scorpio", "sequence": 8},
+    {"code": "SAGITTARIUS", "displayName": "Sagittarius", "english": "Sagittarius", "sequence": 9},
+    {"code": "CAPRICORN", "displayName": "Capricorn", "english": "Capricorn", "sequence": 10},
+    {"code": "AQUARIUS", "displayName": "Aquarius", "english": "Aquarius", "sequence": 11},
+    {"code": "PISCES", "displayName": "Pisces", "english": "Pisces", "sequence": 12},
+  )
+)
+
+# Built-in timezone aliases for the stub alias list (lowercase key -> IANA id).
+_DEFAULT_TZ_ALIASES = MappingProxyType(
+  {
+    "asia/chennai": "Asia/Kolkata",
+    "asia/calcutta": "Asia/Kolkata",
+    "ist": "Asia/Kolkata",
+    "pst": "America/Los_Angeles",
+    "pdt": "America/Los_Angeles",
+    "est": "America/New_York",
+    "edt": "America/New_York",
+    "cst": "America/Chicago",
+    "cdt": "America/Chicago",
+    "mst": "America/Denver",
+    "mdt": "America/Denver",
+    "bst": "Europe/London",
+    "cet": "Europe/Berlin",
+    "cest": "Europe/Berlin",
+    "aest": "Australia/Sydney",
+    "aedt": "Australia/Sydney",
+    "nzst": "Pacific/Auckland",
+    "hkt": "Asia/Hong_Kong",
+    "sgt": "Asia/Singapore",
+    "wib": "Asia/Jakarta",
+  }
+)
+
+# Static Graph query options per list; callers add the per-request $filter.
+_TZ_ALIAS_PARAMS = MappingProxyType(
+  {
+    "$top": 1,
+    "$expand": "fields($select=Title,TimeZone)",
+  }
+)
+
+_TZ_ALIAS_RECORD_PARAMS = MappingProxyType(
+  {
+    "$top": 1,
+    "$expand": "fields($select=Title,TimeZone,lat,long)",
+  }
+)
+
+_ZODIAC_SIGN_PARAMS = MappingProxyType(
+  {
+    "$top": 200,
+    "$expand": "fields($select=Title,English,Tamil,Hindi,Sequence,Methodology)",
+    "$orderby": "fields/Sequence asc",
+  }
+)
+
+_PROMPT_TEMPLATE_PARAMS = MappingProxyType(
+  {
+    "$top": 1,
+    "$expand": "fields($select=Title,PromptVersion,PromptId,PromptText,Active,Methodology)",
+  }
+)
+
+_CACHE_BATCH_PARAMS = MappingProxyType(
+  {
+    "$top": 1,
+    "$expand": "fields($select=Title,HoroscopeMethod,StartDate,EndDate,Output,ZodiacSigns)",
+  }
+)
+
+# Stub prompt template; only the methodology varies per call.
+_STUB_PROMPT_BASE = MappingProxyType(
+  {
+    "title": "Generic Astrology Assistant",
+    "version": 1,
+    "text": "You are an astrology assistant. Provide general guidance for the requested sign.",
+    "active": True,
+  }
+)
+
+
+class _GraphToken(NamedTuple):
+  value: str
+  refresh_at: float  # time.monotonic() deadline, already shortened by _TOKEN_REFRESH_MARGIN_SECONDS
+  read_headers: Mapping[str, str]
+  write_headers: Mapping[str, str]
+
+
+def _new_graph_token(value: str, refresh_at: float) -> _GraphToken:
+  auth = f"Bearer {value}"
+  # HonorNonIndexedQueriesWarningMayFailRandomly allows filtering on non-indexed columns (Methodology).
+  # It only keeps small lists working: index Methodology on large lists
+  # so these filters stop scanning past the list view threshold.
+  read_headers = {"Authorization": auth, "Prefer": "HonorNonIndexedQueriesWarningMayFailRandomly"}
+  write_headers = {"Authorization": auth, "Content-Type": "application/json"}
+  return _GraphToken(value, refresh_at, MappingProxyType(read_headers), MappingProxyType(write_headers))
+
+
+@dataclass(slots=True)
 class CachedGuidance:
-  cache_key: str
   payload: dict
-  created_at: datetime
-  expires_at: datetime
+  expires_at: float  # time.monotonic() deadline
 
-  def is_valid(self) -> bool:
-    return datetime.utcnow() < self.expires_at
+  def is_valid(self, now: float) -> bool:
+    return now < self.expires_at
 
 
 class SharePointClientStub:
@@ -35,9 +173,11 @@ class SharePointClientStub:
   - Auth handled via app registration / client credentials
   """
 
-  def __init__(self):
-    self._guidance_cache: Dict[str, CachedGuidance] = {}
-    self._translations: Dict[Tuple[str, str], dict] = {}
+  def __init__(self, http_client: httpx.AsyncClient):
+    # Shared Graph pool from deps; its lifecycle (and aclose on shutdown) is owned there.
+    self._http = http_client
+    self._guidance_cache: "OrderedDict[str, CachedGuidance]" = OrderedDict()
+    self._translations: Dict[str, Dict[str, dict]] = {}  # language -> key -> record
     self._profiles: Dict[str, dict] = {}
     self._graph_enabled = settings.sharepoint_mode.lower() == "graph"
     self._tenant_id = settings.sharepoint_tenant_id
@@ -48,71 +188,77 @@ class SharePointClientStub:
     self._prompt_list_id = settings.sharepoint_prompt_list_id
     self._cache_list_id = settings.sharepoint_cache_list_id
     self._tz_alias_list_id = settings.sharepoint_timezone_alias_list_id
-    self._graph_token: Optional[Tuple[str, datetime]] = None
-    self._tz_aliases: Dict[str, str] = {
-      "asia/chennai": "Asia/Kolkata",
-      "asia/calcutta": "Asia/Kolkata",
-      "ist": "Asia/Kolkata",
-      "pst": "America/Los_Angeles",
-      "pdt": "America/Los_Angeles",
-      "est": "America/New_York",
-      "edt": "America/New_York",
-      "cst": "America/Chicago",
-      "cdt": "America/Chicago",
-      "mst": "America/Denver",
-      "mdt": "America/Denver",
-      "bst": "Europe/London",
-      "cet": "Europe/Berlin",
-      "cest": "Europe/Berlin",
-      "aest": "Australia/Sydney",
-      "aedt": "Australia/Sydney",
-      "nzst": "Pacific/Auckland",
-      "hkt": "Asia/Hong_Kong",
-      "sgt": "Asia/Singapore",
-      "wib": "Asia/Jakarta",
+    lists_url = f"https://graph.microsoft.com/v1.0/sites/{self._site_id}/lists"
+    self._zodiac_items_url = f"{lists_url}/{self._zodiac_list_id}/items"
+    self._prompt_items_url = f"{lists_url}/{self._prompt_list_id}/items"
+    self._cache_items_url = f"{lists_url}/{self._cache_list_id}/items"
+    self._tz_alias_items_url = f"{lists_url}/{self._tz_alias_list_id}/items"
+    self._graph_token: Optional[_GraphToken] = None
+    # Concurrent token refreshes and list reads for the same key share one Graph round trip.
+    self._flight = SingleFlight()
+    # (kind, methodology) -> (monotonic expiry, value) for rarely changing Graph lists.
+    self._graph_lookups: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+    # Seeded from the built-in aliases; upserts add to this per-instance copy.
+    self._tz_aliases: Dict[str, str] = dict(_DEFAULT_TZ_ALIASES)
+    # Alias keys known to exist in the Graph list, so repeat upserts skip the existence GET.
+    self._graph_tz_keys: set = set()
+    # Stub alias records with coordinates, keyed by (lat, long); the first record for a point wins.
+    self._tz_alias_records: Dict[Tuple[str, str], dict] = {}
+    # Placeholder SharePoint "ZodiacSigns" list keyed by methodology, held in sequence order
+    self._zodiac_signs: Dict[str, Sequence[Mapping[str, object]]] = {
+      "tamil": _BASE_SIGNS,
+      "vedic": _BASE_SIGNS,
+      "western": _BASE_SIGNS,
     }
-    self._tz_alias_records: List[dict] = []
-    base_signs = [
-      {"code": "ARIES", "displayName": "Aries", "english": "Aries", "sequence": 1},
-      {"code": "TAURUS", "displayName": "Taurus", "english": "Taurus", "sequence": 2},
-      {"code": "GEMINI", "displayName": "Gemini", "english": "Gemini", "sequence": 3},
-      {"code": "CANCER", "displayName": "Cancer", "english": "Cancer", "sequence": 4},
-      {"code": "LEO", "displayName": "Leo", "english": "Leo", "sequence": 5},
-      {"code": "VIRGO", "displayName": "Virgo", "english": "Virgo", "sequence": 6},
-      {"code": "LIBRA", "displayName": "Libra", "english": "Libra", "sequence": 7},
-      {"code": "SCORPIO", "displayName": "Scorpio", "english": "Scorpio", "sequence": 8},
-      {"code": "SAGITTARIUS", "displayName": "Sagittarius", "english": "Sagittarius", "sequence": 9},
-      {"code": "CAPRICORN", "displayName": "Capricorn", "english": "Capricorn", "sequence": 10},
-      {"code": "AQUARIUS", "displayName": "Aquarius", "english": "Aquarius", "sequence": 11},
-      {"code": "PISCES", "displayName": "Pisces", "english": "Pisces", "sequence": 12},
-    ]
-    # Placeholder SharePoint "ZodiacSigns" list keyed by methodology
-    self._zodiac_signs: Dict[str, List[dict]] = {
-      "tamil": base_signs,
-      "vedic": base_signs,
-      "western": base_signs,
+    self._zodiac_signs = {
+      key: tuple(sorted(signs, key=lambda s: s.get("sequence", 0))) for key, signs in self._zodiac_signs.items()
     }
 
-  async def get_cached_guidance(self, cache_key: str) -> Optional[dict]:
+  def _cached_payload(self, cache_key: str, now: float) -> Optional[dict]:
     record = self._guidance_cache.get(cache_key)
-    if record and record.is_valid():
-      return record.payload
-    return None
+    if record is None:
+      return None
+    if not record.is_valid(now):
+      del self._guidance_cache[cache_key]
+      return None
+    self._guidance_cache.move_to_end(cache_key)
+    return record.payload
+
+  async def get_cached_guidance(self, cache_key: str) -> Optional[dict]:
+    return self._cached_payload(cache_key, time.monotonic())
+
+  async def get_cached_guidance_many(self, cache_keys: List[str]) -> Dict[str, dict]:
+    """
+    Look up several guidance cache keys in one call; only valid hits are returned.
+    """
+    hits: Dict[str, dict] = {}
+    now = time.monotonic()
+    for cache_key in cache_keys:
+      payload = self._cached_payload(cache_key, now)
+      if payload is not None:
+        hits[cache_key] = payload
+    return hits
 
   async def put_cached_guidance(self, cache_key: str, payload: dict, ttl_seconds: int) -> None:
-    self._guidance_cache[cache_key] = CachedGuidance(
-      cache_key=cache_key,
-      payload=payload,
-      created_at=datetime.utcnow(),
-      expires_at=datetime.utcnow() + timedelta(seconds=ttl_seconds),
-    )
+    now = time.monotonic()
+    cache = self._guidance_cache
+    cache[cache_key] = CachedGuidance(payload=payload, expires_at=now + ttl_seconds)
+    cache.move_to_end(cache_key)
+    if len(cache) > _GUIDANCE_CACHE_CAP:
+      cache.popitem(last=False)
+    # Amortized sweep: drop a few expired entries from the cold end so dead payloads do not linger.
+    for _ in range(_GUIDANCE_SWEEP_PER_PUT):
+      if not cache or next(iter(cache.values())).is_valid(now):
+        break
+      cache.popitem(last=False)
 
   async def get_translations(self, keys: List[str], language: str) -> Dict[str, dict]:
-    return {k: self._translations[(k, language)] for k in keys if (k, language) in self._translations}
+    table = self._translations.get(language, {})
+    return {k: v for k in keys if (v := table.get(k)) is not None}
 
   async def upsert_translation(self, key: str, language: str, value: str, status: str = "Draft") -> dict:
     data = {"key": key, "language": language, "value": value, "status": status, "lastTranslatedBy": "AI"}
-    self._translations[(key, language)] = data
+    self._translations.setdefault(language, {})[key] = data
     return data
 
   async def upsert_profile(self, identifier: str, profile: dict) -> dict:
@@ -131,7 +277,7 @@ class SharePointClientStub:
 
   async def audit(self, event_type: str, metadata: dict) -> None:
     # TODO: Persist to SharePoint AuditEvents list
-    await asyncio.sleep(0)
+    return None
 
   async def get_zodiac_signs(self, methodology: str) -> List[dict]:
     """
@@ -141,25 +287,31 @@ class SharePointClientStub:
     if self._graph_enabled:
       if not self._graph_configured():
         raise RuntimeError("SharePoint Graph not configured; check tenant/client/site/list IDs.")
-      records = await self._get_zodiac_signs_graph(methodology)
+      records = await self._cached_graph_lookup(
+        ("signs", methodology), lambda: self._get_zodiac_signs_graph(methodology)
+      )
       if records:
-        return records
+        return list(records)
       raise RuntimeError("SharePoint returned no zodiac signs for the requested methodology.")
 
     key = methodology.lower()
-    signs = self._zodiac_signs.get(key, self._zodiac_signs.get("western", []))
-    return sorted(signs, key=lambda s: s.get("sequence", 0))
+    signs = self._zodiac_signs.get(key, self._zodiac_signs.get("western", ()))
+    return list(signs)
 
   async def get_timezone_alias(self, key: str) -> Optional[str]:
     normalized = key.strip().lower()
-    if self._graph_enabled:
-      try:
-        alias = await self._get_timezone_alias_graph(normalized)
-        if alias:
-          return alias
-      except Exception:
-        pass
-    return self._tz_aliases.get(normalized)
+    # Built-in and previously seen aliases answer locally; only unknown keys cost a Graph round trip.
+    alias = self._tz_aliases.get(normalized)
+    if alias or not self._graph_enabled:
+      return alias
+    try:
+      alias = await self._get_timezone_alias_graph(normalized)
+    except Exception:
+      return None
+    if alias:
+      self._tz_aliases[normalized] = alias
+      self._graph_tz_keys.add(normalized)
+    return alias
 
   async def upsert_timezone_alias(self, key: str, timezone: str) -> None:
     normalized = key.strip().lower()
@@ -190,22 +342,34 @@ class SharePointClientStub:
         return await self._get_timezone_alias_record_by_coords_graph(lat_key, lon_key)
       except Exception:
         pass
-    for rec in self._tz_alias_records:
-      if rec.get("lat") == lat_key and rec.get("long") == lon_key:
-        return rec
-    return None
+    return self._tz_alias_records.get((lat_key, lon_key))
 
   async def upsert_timezone_alias_record(self, key: str, timezone: str, lat: Optional[str], lon: Optional[str]) -> None:
     normalized = key.strip().lower()
     self._tz_aliases[normalized] = timezone
     if lat is not None and lon is not None:
-      self._tz_alias_records.append({"title": key, "timezone": timezone, "lat": lat, "long": lon})
+      self._tz_alias_records.setdefault((lat, lon), {"title": key, "timezone": timezone, "lat": lat, "long": lon})
     if self._graph_enabled:
       try:
         await self._upsert_timezone_alias_record_graph(normalized, timezone, lat, lon)
       except Exception:
         return
 
+  async def _cached_graph_lookup(self, key: Tuple[str, str], fetch: Callable[[], Awaitable[Any]]) -> Any:
+    hit = self._graph_lookups.get(key)
+    if hit and hit[0] > time.monotonic():
+      return hit[1]
+
+    async def load() -> Any:
+      # Every caller shares this object for the whole TTL, so hand it out read-only like the stub rows.
+      value = _freeze(await fetch())
+      # Empty results are not cached so a newly populated list shows up on the next call.
+      if value:
+        self._graph_lookups[key] = (time.monotonic() + _GRAPH_LOOKUP_TTL_SECONDS, value)
+      return value
+
+    return await self._flight.run(key, load)
+
   def _graph_configured(self) -> bool:
     return all(
       [
@@ -219,10 +383,14 @@ class SharePointClientStub:
       ]
     )
 
-  async def _get_graph_token(self) -> Optional[str]:
-    now = datetime.utcnow()
-    if self._graph_token and self._graph_token[1] > now + timedelta(seconds=30):
-      return self._graph_token[0]
+  async def _get_graph_token(self) -> _GraphToken:
+    token = self._graph_token
+    if token and token.refresh_at > time.monotonic():
+      return token
+    return await self._flight.run("graph-token", self._fetch_graph_token)
+
+  async def _fetch_graph_token(self) -> _GraphToken:
+    now = time.monotonic()
     token_url = f"https://login.microsoftonline.com/{self._tenant_id}/oauth2/v2.0/token"
     data = {
       "client_id": self._client_id,
@@ -230,43 +398,34 @@ class SharePointClientStub:
       "grant_type": "client_credentials",
       "scope": "https://graph.microsoft.com/.default",
     }
-    async with httpx.AsyncClient(timeout=10.0) as client:
-      resp = await client.post(token_url, data=data)
-      resp.raise_for_status()
-      payload = resp.json()
-      access_token = payload["access_token"]
-      expires_in = int(payload.get("expires_in", 3600))
-      self._graph_token = (access_token, now + timedelta(seconds=expires_in))
-      return access_token
+    resp = await self._http.post(token_url, data=data)
+    resp.raise_for_status()
+    payload = resp.json()
+    access_token = payload["access_token"]
+    expires_in = int(payload.get("expires_in", 3600))
+    self._graph_token = _new_graph_token(access_token, now + expires_in - _TOKEN_REFRESH_MARGIN_SECONDS)
+    return self._graph_token
 
   async def _graph_get(self, url: str, params: Optional[dict] = None) -> dict:
     token = await self._get_graph_token()
-    headers = {"Authorization": f"Bearer {token}"}
-    # HonorNonIndexedQueriesWarningMayFailRandomly allows filtering on non-indexed columns (Methodology)
-    headers["Prefer"] = "HonorNonIndexedQueriesWarningMayFailRandomly"
-    async with httpx.AsyncClient(timeout=10.0) as client:
-      resp = await client.get(url, headers=headers, params=params)
-      resp.raise_for_status()
-      return resp.json()
+    resp = await self._http.get(url, headers=token.read_headers, params=params)
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
 
   async def _graph_post_item(self, url: str, fields: dict) -> dict:
     token = await self._get_graph_token()
-    headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-    async with httpx.AsyncClient(timeout=10.0) as client:
-      resp = await client.post(url, headers=headers, json={"fields": fields})
-      resp.raise_for_status()
-      return resp.json()
+    resp = await self._http.post(url, headers=token.write_headers, json={"fields": fields})
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
 
   async def _get_timezone_alias_graph(self, key: str) -> Optional[str]:
     if not self._tz_alias_list_id:
       return None
-    base_url = f"https://graph.microsoft.com/v1.0/sites/{self._site_id}/lists/{self._tz_alias_list_id}/items"
     params = {
-      "$top": 1,
-      "$expand": "fields($select=Title,TimeZone)",
-      "$filter": f"fields/Title eq '{key}'",
+      **_TZ_ALIAS_PARAMS,
+      "$filter": f"fields/Title eq '{_odata_escape(key)}'",
     }
-    data = await self._graph_get(base_url, params=params)
+    data = await self._graph_get(self._tz_alias_items_url, params=params)
     items = data.get("value", [])
     if not items:
       return None
@@ -276,13 +435,11 @@ class SharePointClientStub:
   async def _get_timezone_alias_record_graph(self, key: str) -> Optional[dict]:
     if not self._tz_alias_list_id:
       return None
-    base_url = f"https://graph.microsoft.com/v1.0/sites/{self._site_id}/lists/{self._tz_alias_list_id}/items"
     params = {
-      "$top": 1,
-      "$expand": "fields($select=Title,TimeZone,lat,long)",
-      "$filter": f"fields/Title eq '{key}'",
+      **_TZ_ALIAS_RECORD_PARAMS,
+      "$filter": f"fields/Title eq '{_odata_escape(key)}'",
     }
-    data = await self._graph_get(base_url, params=params)
+    data = await self._graph_get(self._tz_alias_items_url, params=params)
     items = data.get("value", [])
     if not items:
       return None
@@ -292,13 +449,11 @@ class SharePointClientStub:
   async def _get_timezone_alias_record_by_coords_graph(self, lat: str, lon: str) -> Optional[dict]:
     if not self._tz_alias_list_id:
       return None
-    base_url = f"https://graph.microsoft.com/v1.0/sites/{self._site_id}/lists/{self._tz_alias_list_id}/items"
     params = {
-      "$top": 1,
-      "$expand": "fields($select=Title,TimeZone,lat,long)",
-      "$filter": f"fields/lat eq '{lat}' and fields/long eq '{lon}'",
+      **_TZ_ALIAS_RECORD_PARAMS,
+      "$filter": f"fields/lat eq '{_odata_escape(lat)}' and fields/long eq '{_odata_escape(lon)}'",
     }
-    data = await self._graph_get(base_url, params=params)
+    data = await self._graph_get(self._tz_alias_items_url, params=params)
     items = data.get("value", [])
     if not items:
       return None
@@ -308,57 +463,44 @@ class SharePointClientStub:
   async def _upsert_timezone_alias_graph(self, key: str, timezone: str) -> None:
     if not self._tz_alias_list_id:
       return
-    existing = await self._get_timezone_alias_graph(key)
-    if existing:
+    if key in self._graph_tz_keys:
       return
-    base_url = f"https://graph.microsoft.com/v1.0/sites/{self._site_id}/lists/{self._tz_alias_list_id}/items"
-    await self._graph_post_item(base_url, {"Title": key, "TimeZone": timezone})
+    existing = await self._get_timezone_alias_graph(key)
+    if not existing:
+      await self._graph_post_item(self._tz_alias_items_url, {"Title": key, "TimeZone": timezone})
+    self._graph_tz_keys.add(key)
 
   async def _upsert_timezone_alias_record_graph(self, key: str, timezone: str, lat: Optional[str], lon: Optional[str]) -> None:
     if not self._tz_alias_list_id:
       return
-    base_url = f"https://graph.microsoft.com/v1.0/sites/{self._site_id}/lists/{self._tz_alias_list_id}/items"
-    await self._graph_post_item(base_url, {"Title": key, "TimeZone": timezone, "lat": lat, "long": lon})
+    await self._graph_post_item(self._tz_alias_items_url, {"Title": key, "TimeZone": timezone, "lat": lat, "long": lon})
 
   async def _get_zodiac_signs_graph(self, methodology: str) -> List[dict]:
-    base_url = f"https://graph.microsoft.com/v1.0/sites/{self._site_id}/lists/{self._zodiac_list_id}/items"
     params = {
-      "$top": 200,
-      "$expand": "fields($select=Title,English,Tamil,Hindi,Sequence,Methodology)",
-      "$filter": f"fields/Methodology eq '{methodology}'",
-      "$orderby": "fields/Sequence asc",
+      **_ZODIAC_SIGN_PARAMS,
+      "$filter": f"fields/Methodology eq '{_odata_escape(methodology)}'",
     }
     try:
-      data = await self._graph_get(base_url, params=params)
+      data = await self._graph_get(self._zodiac_items_url, params=params)
     except httpx.HTTPStatusError as exc:
       detail = exc.response.text
       raise RuntimeError(f"Graph returned {exc.response.status_code}: {detail}") from exc
     except httpx.RequestError as exc:
       raise RuntimeError(f"Graph request failed: {exc}") from exc
-    items = data.get("value", [])
-    records: List[dict] = []
-    for item in items:
-      fields = item.get("fields", {})
-      code = fields.get("Title")
-      method = fields.get("Methodology") or methodology
-      english = fields.get("English")
-      tamil = fields.get("Tamil")
-      hindi = fields.get("Hindi")
-      sequence = fields.get("Sequence")
-      display = code
-      if code:
-        records.append(
-          {
-            "code": code,
-            "displayName": display,
-            "english": english,
-            "tamil": tamil,
-            "hindi": hindi,
-            "methodology": method,
-            "sequence": sequence,
-          }
-        )
-    return records
+    rows = [item.get("fields", {}) for item in data.get("value", [])]
+    return [
+      {
+        "code": fields["Title"],
+        "displayName": fields["Title"],
+        "english": fields.get("English"),
+        "tamil": fields.get("Tamil"),
+        "hindi": fields.get("Hindi"),
+        "methodology": fields.get("Methodology") or methodology,
+        "sequence": fields.get("Sequence"),
+      }
+      for fields in rows
+      if fields.get("Title")
+    ]
 
   async def get_prompt_template(self, methodology: str) -> Optional[dict]:
     """
@@ -367,26 +509,19 @@ class SharePointClientStub:
     if self._graph_enabled:
       if not self._graph_configured():
         raise RuntimeError("SharePoint Graph not configured; check tenant/client/site/list IDs.")
-      return await self._get_prompt_template_graph(methodology)
+      return await self._cached_graph_lookup(
+        ("prompt", methodology), lambda: self._get_prompt_template_graph(methodology)
+      )
 
-    # Stub prompt
-    return {
-      "title": "Generic Astrology Assistant",
-      "version": 1,
-      "methodology": methodology,
-      "text": "You are an astrology assistant. Provide general guidance for the requested sign.",
-      "active": True,
-    }
+    return {**_STUB_PROMPT_BASE, "methodology": methodology}
 
   async def _get_prompt_template_graph(self, methodology: str) -> Optional[dict]:
-    base_url = f"https://graph.microsoft.com/v1.0/sites/{self._site_id}/lists/{self._prompt_list_id}/items"
     params = {
-      "$top": 1,
-      "$expand": "fields($select=Title,PromptVersion,PromptId,PromptText,Active,Methodology)",
-      "$filter": f"fields/Title eq 'Generic Astrology Assistant' and fields/Methodology eq '{methodology}' and fields/Active eq 1",
+      **_PROMPT_TEMPLATE_PARAMS,
+      "$filter": f"fields/Title eq 'Generic Astrology Assistant' and fields/Methodology eq '{_odata_escape(methodology)}' and fields/Active eq 1",
     }
     try:
-      data = await self._graph_get(base_url, params=params)
+      data = await self._graph_get(self._prompt_items_url, params=params)
     except httpx.HTTPStatusError as exc:
       detail = exc.response.text
       raise RuntimeError(f"Graph returned {exc.response.status_code}: {detail}") from exc
@@ -411,18 +546,13 @@ class SharePointClientStub:
   ) -> Optional[dict]:
     if not self._graph_enabled:
       return None
-    base_url = f"https://graph.microsoft.com/v1.0/sites/{self._site_id}/lists/{self._cache_list_id}/items"
     params = {
-      "$top": 1,
-      "$expand": "fields($select=Title,HoroscopeMethod,StartDate,EndDate,Output,ZodiacSigns)",
-      "$filter": (
-        f"fields/HoroscopeMethod eq '{methodology}' "
-        f"and fields/StartDate eq '{start_date}' and fields/EndDate eq '{end_date}' "
-        f"and fields/ZodiacSigns eq '{zodiac_signs}'"
-      ),
+      **_CACHE_BATCH_PARAMS,
+      # Title holds a hex digest, so it needs no escaping and the lookup is one indexed equality.
+      "$filter": f"fields/Title eq '{_batch_key(methodology, title, start_date, end_date, zodiac_signs)}'",
     }
     try:
-      data = await self._graph_get(base_url, params=params)
+      data = await self._graph_get(self._cache_items_url, params=params)
     except Exception:
       return None
     items = data.get("value", [])
@@ -433,7 +563,7 @@ class SharePointClientStub:
     if not output:
       return None
     try:
-      return json.loads(output)
+      return orjson.loads(output)
     except Exception:
       return None
 
@@ -442,16 +572,15 @@ class SharePointClientStub:
   ) -> None:
     if not self._graph_enabled:
       return
-    base_url = f"https://graph.microsoft.com/v1.0/sites/{self._site_id}/lists/{self._cache_list_id}/items"
     fields = {
-      "Title": title,
+      "Title": _batch_key(methodology, title, start_date, end_date, zodiac_signs),
       "HoroscopeMethod": methodology,
       "StartDate": start_date,
       "EndDate": end_date,
       "ZodiacSigns": zodiac_signs,
-      "Output": json.dumps(payload),
+      "Output": orjson.dumps(payload).decode(),
     }
     try:
-      await self._graph_post_item(base_url, fields)
+      await self._graph_post_item(self._cache_items_url, fields)
     except Exception:
       return
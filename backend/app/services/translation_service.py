@@ -1,3 +1,4 @@
+import asyncio
 from typing import List
 
 from ..schemas import TranslationItem, TranslationResponse
@@ -12,17 +13,17 @@ class TranslationService:
         cached = await self.sharepoint.get_translations(keys, language)
         cached_keys = list(cached.keys())
 
-        generated: list = []
-        translations: list = []
-        for key in keys:
-            if key in cached:
-                translations.append(TranslationItem(**cached[key]))
-                continue
-            # Placeholder AI translation; replace with LLM call
-            synthetic = f"[{language}] {key.replace('.', ' ').title()}"
-            stored = await self.sharepoint.upsert_translation(key, language, synthetic)
-            translations.append(TranslationItem(**stored))
-            generated.append(key)
+        generated = [key for key in keys if key not in cached]
+        # Placeholder AI translation; replace with LLM call
+        stored = iter(
+            await asyncio.gather(
+                *(
+                    self.sharepoint.upsert_translation(key, language, f"[{language}] {key.replace('.', ' ').title()}")
+                    for key in generated
+                )
+            )
+        )
+        translations = [TranslationItem(**(cached[key] if key in cached else next(stored))) for key in keys]
 
         correlation_id = f"translations:{language}:{len(keys)}"
         return TranslationResponse(
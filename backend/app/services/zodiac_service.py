@@ -1,16 +1,26 @@
-from typing import List
+from typing import Dict, List, Sequence, Tuple
 
 from ..schemas import ZodiacSign
 from .sharepoint_client import SharePointClientStub
 
+# Methodology is caller-supplied; bound how many distinct values keep a prebuilt list.
+_PREBUILT_CAP = 32
+
 
 class ZodiacService:
     def __init__(self, sharepoint: SharePointClientStub):
         self.sharepoint = sharepoint
+        # methodology -> (source records, built signs); reused while SharePoint returns the same record objects.
+        self._prebuilt: Dict[str, Tuple[Sequence[dict], List[ZodiacSign]]] = {}
 
     async def list_signs(self, methodology: str) -> List[ZodiacSign]:
         records = await self.sharepoint.get_zodiac_signs(methodology)
-        return [
+        cached = self._prebuilt.get(methodology)
+        if cached is not None:
+            source, signs = cached
+            if len(source) == len(records) and all(a is b for a, b in zip(source, records)):
+                return list(signs)
+        signs = [
             ZodiacSign(
                 code=rec.get("code"),
                 displayName=rec.get("displayName"),
@@ -22,3 +32,6 @@ class ZodiacService:
             )
             for rec in records
         ]
+        if methodology in self._prebuilt or len(self._prebuilt) < _PREBUILT_CAP:
+            self._prebuilt[methodology] = (tuple(records), signs)
+        return list(signs)
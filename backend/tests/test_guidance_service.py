@@ -0,0 +1,118 @@
+import asyncio
+import time
+import unittest
+from datetime import date
+
+import httpx
+
+from app.schemas import PreferenceLite
+from app.services.guidance_service import GuidanceService
+from app.services.sharepoint_client import SharePointClientStub
+
+
+class CountingGuidanceService(GuidanceService):
+    """Counts calls to the generator so tests can tell cache hits from regenerations."""
+
+    def __init__(self, sharepoint):
+        super().__init__(sharepoint)
+        self.generated = []
+
+    async def _fallback_generate(self, context, category_bundle, profile):
+        self.generated.append(context.sign)
+        return await super()._fallback_generate(context, category_bundle, profile)
+
+
+class GuidanceServiceTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.http = httpx.AsyncClient()
+        self.sharepoint = SharePointClientStub(http_client=self.http)
+        self.service = CountingGuidanceService(self.sharepoint)
+
+    async def asyncTearDown(self):
+        await self.http.aclose()
+
+    async def get(self, sign="ARIES", period_type="month"):
+        today = date.today()
+        return await self.service.get_guidance(
+            preferences=PreferenceLite(language="en", methodology="tamil", sign=sign),
+            sign=sign,
+            period_type=period_type,
+            start_date=today,
+            end_date=today,
+            category_bundle=None,
+            personalized=False,
+            profile=None,
+        )
+
+    def age_entry(self, cache_key, seconds):
+        self.sharepoint._guidance_cache[cache_key].payload["generatedAt"] = time.time() - seconds
+
+    async def drain_refreshes(self):
+        while self.service._refresh_tasks:
+            await asyncio.gather(*self.service._refresh_tasks)
+
+    async def test_stale_hit_through_get_guidance_is_regenerated(self):
+        first = await self.get()
+        self.assertEqual(self.service.generated, ["ARIES"])
+
+        self.age_entry(first.correlationId, self.service._determine_ttl("month") + 60)
+        stale = await self.get()
+        self.assertEqual(stale.correlationId, first.correlationId)
+        await self.drain_refreshes()
+
+        self.assertEqual(self.service.generated, ["ARIES", "ARIES"])
+        refreshed = self.sharepoint._guidance_cache[first.correlationId].payload
+        self.assertLess(time.time() - refreshed["generatedAt"], 60)
+
+    async def test_fresh_hit_is_not_regenerated(self):
+        await self.get()
+        await self.get()
+        await self.drain_refreshes()
+        self.assertEqual(self.service.generated, ["ARIES"])
+
+    async def get_many(self, signs, period_type="month"):
+        today = date.today()
+        return await self.service.get_guidance_many(
+            preferences=PreferenceLite(language="en", methodology="tamil", sign=None),
+            signs=signs,
+            period_type=period_type,
+            start_date=today,
+            end_date=today,
+            category_bundle=None,
+            personalized=False,
+            profile=None,
+        )
+
+    async def test_many_returns_one_result_per_sign_in_request_order(self):
+        responses = await self.get_many(["LEO", "ARIES", "LEO", "VIRGO", "ARIES"])
+        self.assertEqual([r.context.sign for r in responses], ["LEO", "ARIES", "LEO", "VIRGO", "ARIES"])
+        self.assertEqual(responses[0], responses[2])
+        self.assertEqual(responses[1], responses[4])
+        # Repeated signs are generated once.
+        self.assertEqual(sorted(self.service.generated), ["ARIES", "LEO", "VIRGO"])
+
+    async def test_many_generates_only_misses_and_matches_single_sign_results(self):
+        single = await self.get("ARIES")
+        responses = await self.get_many(["TAURUS", "ARIES", "GEMINI"])
+        self.assertEqual([r.context.sign for r in responses], ["TAURUS", "ARIES", "GEMINI"])
+        self.assertEqual(responses[1].correlationId, single.correlationId)
+        self.assertEqual(self.service.generated, ["ARIES", "TAURUS", "GEMINI"])
+
+        # Misses were stored under the same keys get_guidance uses.
+        self.assertEqual((await self.get("GEMINI")).correlationId, responses[2].correlationId)
+        self.assertEqual(len(self.service.generated), 3)
+
+    async def test_many_serves_a_stale_hit_and_refreshes_it(self):
+        stale = await self.get("ARIES")
+        self.age_entry(stale.correlationId, self.service._determine_ttl("month") + 60)
+
+        responses = await self.get_many(["ARIES", "LEO"])
+        self.assertEqual(responses[0].correlationId, stale.correlationId)
+        await self.drain_refreshes()
+        self.assertEqual(sorted(self.service.generated), ["ARIES", "ARIES", "LEO"])
+        refreshed = self.sharepoint._guidance_cache[stale.correlationId].payload
+        self.assertLess(time.time() - refreshed["generatedAt"], 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
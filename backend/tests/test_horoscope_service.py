@@ -0,0 +1,60 @@
+import unittest
+from unittest import mock
+
+import httpx
+
+from app.services import horoscope_service
+from app.services.horoscope_service import HoroscopeService
+from app.services.sharepoint_client import SharePointClientStub
+
+
+class HoroscopeServiceTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.http = httpx.AsyncClient()
+        self.service = HoroscopeService(SharePointClientStub(http_client=self.http))
+
+    async def asyncTearDown(self):
+        self.service.close()
+        await self.http.aclose()
+
+    def test_unpadded_date_and_time_parse_like_padded_ones(self):
+        padded = self.service._parse_datetime("2030-01-05", "09:30:05", "Asia/Kolkata")
+        for date_str, time_str in (("2030-01-05", "9:30:05"), ("2030-1-5", "9:30:5")):
+            self.assertEqual(self.service._parse_datetime(date_str, time_str, "Asia/Kolkata"), padded)
+
+    def test_malformed_time_is_a_value_error(self):
+        with self.assertRaises(ValueError):
+            self.service._parse_datetime("2030-01-05", "25:00", "Asia/Kolkata")
+
+    async def test_repeat_request_is_served_from_cache_with_a_new_correlation_id(self):
+        request = dict(date="2030-01-05", time="09:30", lat=13.08, lon=80.27, tz="Asia/Kolkata")
+        with mock.patch.object(self.service, "_generate_sync", wraps=self.service._generate_sync) as generate_sync:
+            first = await self.service.generate(**request)
+            second = await self.service.generate(**request)
+        self.assertEqual(generate_sync.call_count, 1)
+        self.assertNotEqual(first.pop("correlationId"), second.pop("correlationId"))
+        self.assertEqual(first, second)
+        # Charts live in their own cache, not the SharePoint guidance cache.
+        self.assertEqual(len(self.service.sharepoint._guidance_cache), 0)
+
+    def test_cached_response_expires_after_ttl(self):
+        now = 1_000.0
+        with mock.patch.object(horoscope_service, "monotonic", side_effect=lambda: now):
+            self.service._store_response(("k",), {"summary": "s"})
+            now += horoscope_service._RESPONSE_TTL_SECONDS - 1
+            self.assertEqual(self.service._cached_response(("k",)), {"summary": "s"})
+            now += 2
+            self.assertIsNone(self.service._cached_response(("k",)))
+        self.assertNotIn(("k",), self.service._responses)
+
+    def test_cache_evicts_least_recently_used_at_capacity(self):
+        with mock.patch.object(horoscope_service, "_RESPONSE_CACHE_CAP", 2):
+            self.service._store_response(("a",), {"summary": "a"})
+            self.service._store_response(("b",), {"summary": "b"})
+            self.assertIsNotNone(self.service._cached_response(("a",)))
+            self.service._store_response(("c",), {"summary": "c"})
+        self.assertEqual(list(self.service._responses), [("a",), ("c",)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+from unittest import mock
+
+from app.config import settings
+from app.services.otp_service import OTPService
+
+TTL = settings.otp_ttl_seconds
+
+
+class OTPServiceTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.now = 1_000_000.0
+        patcher = mock.patch("app.services.otp_service.time.time", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.service = OTPService()
+
+    async def test_reissued_otp_outlives_the_first_expiry(self):
+        await self.service.generate("a@example.com")
+        self.now += TTL / 2
+        second = await self.service.generate("a@example.com")
+
+        # Past the first OTP's expiry but inside the re-issued one's.
+        self.now += TTL / 2 + 1
+        await self.service.cleanup()
+        self.assertIn("a@example.com", self.service._store)
+        self.assertTrue(await self.service.verify("a@example.com", second))
+
+    async def test_reissued_otp_expires_on_its_own_deadline(self):
+        await self.service.generate("a@example.com")
+        self.now += TTL / 2
+        second = await self.service.generate("a@example.com")
+
+        self.now += TTL + 1
+        await self.service.cleanup()
+        self.assertNotIn("a@example.com", self.service._store)
+        self.assertEqual(self.service._expiry_heap, [])
+        self.assertFalse(await self.service.verify("a@example.com", second))
+
+    async def test_generate_purges_expired_entries_without_cleanup(self):
+        for i in range(50):
+            await self.service.generate(f"user{i}@example.com")
+            await self.service.generate(f"user{i}@example.com")
+        self.assertEqual(len(self.service._expiry_heap), 100)
+
+        self.now += TTL + 1
+        await self.service.generate("late@example.com")
+        self.assertEqual(list(self.service._store), ["late@example.com"])
+        self.assertEqual(len(self.service._expiry_heap), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
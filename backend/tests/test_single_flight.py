@@ -0,0 +1,57 @@
+import asyncio
+import unittest
+
+from app.services.single_flight import SingleFlight
+
+
+class SingleFlightTests(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "value"
+
+        callers = [asyncio.create_task(flight.run("k", work)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        self.assertEqual(await asyncio.gather(*callers), ["value"] * 3)
+        self.assertEqual(calls, 1)
+
+    async def test_leader_cancellation_does_not_cancel_followers(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "value"
+
+        leader = asyncio.create_task(flight.run("k", work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.run("k", work))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await leader
+        release.set()
+        self.assertEqual(await follower, "value")
+
+    async def test_exception_reaches_every_caller_and_clears_the_key(self):
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(flight.run("k", fail), flight.run("k", fail), return_exceptions=True)
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertEqual(await flight.run("k", lambda: asyncio.sleep(0, result="retry")), "retry")
+
+
+if __name__ == "__main__":
+    unittest.main()